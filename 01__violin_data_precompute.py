@@ -10,16 +10,43 @@ Usage:
     python violin_data_precompute.py
 """
 
+import hashlib
 import json
+import mmap
+import os
+import pickle
+import re
+import sys
 from pathlib import Path
 from collections import defaultdict
 from statistics import median, quantiles, stdev
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 # Configuration
 DOCS_DIR = Path("docs")
 INPUT_DIR = DOCS_DIR  # JSON analysis files are in docs/
 OUTPUT_FILE = DOCS_DIR / "violin_data.json"
 STATISTICS_FILE = DOCS_DIR / "statistics.json"
+# Files at least this large are memory-mapped and parsed in place by orjson;
+# smaller ones are cheaper to read() (mmap setup costs more than copying ~12 KB); 0 = never
+MMAP_THRESHOLD = 1024 * 1024
+# Extracted scores per file, reused on the next run while (mtime, size) match (None = no cache)
+SCORES_CACHE_FILE = Path("data/.violin_cache.pickle")
+
+# Generated files in docs/ that are not analyses
+_SKIP_PREFIXES = ('file_index', 'statistics', 'violin_data')
+
+# Known analysis types (including multi-part ones)
+KNOWN_ANALYSIS_TYPES = ('aristoteles', 'dekker', 'kolb', 'schulz_von_thun', 'esthetiek', 'transactional', 'speech_act', 'metaphor', 'narrative')
+
+# Analysis types split on '_', for matching against filename parts without re-joining
+_ANALYSIS_PARTS = frozenset(tuple(analysis_type.split('_')) for analysis_type in KNOWN_ANALYSIS_TYPES)
+_ANALYSIS_LENGTHS = sorted({len(analysis_parts) for analysis_parts in _ANALYSIS_PARTS})
 
 
 def parse_filename(filename: str) -> tuple[str, str, str] | None:
@@ -29,7 +56,7 @@ def parse_filename(filename: str) -> tuple[str, str, str] | None:
     Returns (theologian, sermon, analysis_type) or None if invalid.
     """
 
-    if not filename.endswith('.json') or filename.endswith('.raw') or filename.startswith( 'file_index' ) or filename.startswith( 'statistics' ) or filename.startswith( 'violin_data' ):
+    if not filename.endswith('.json') or filename.startswith(_SKIP_PREFIXES):
         return None
 
     base = filename.replace('.json', '')
@@ -40,19 +67,11 @@ def parse_filename(filename: str) -> tuple[str, str, str] | None:
 
     theologian = parts[0]
 
-    # Known analysis types (including multi-part ones)
-    KNOWN_ANALYSIS_TYPES = ['aristoteles', 'dekker', 'kolb', 'schulz_von_thun', 'esthetiek', 'transactional', 'speech_act', 'metaphor', 'narrative']
-
     # Find where the analysis type starts by looking for known analysis types
     analysis_start_idx = None
     for i in range(1, len(parts)):
-        for analysis_type in KNOWN_ANALYSIS_TYPES:
-            analysis_parts = analysis_type.split('_')
-            candidate = '_'.join(parts[i:i + len(analysis_parts)])
-            if candidate == analysis_type:
-                analysis_start_idx = i
-                break
-        if analysis_start_idx is not None:
+        if any(tuple(parts[i:i + length]) in _ANALYSIS_PARTS for length in _ANALYSIS_LENGTHS):
+            analysis_start_idx = i
             break
 
     if analysis_start_idx is None or analysis_start_idx < 2:
@@ -64,267 +83,290 @@ def parse_filename(filename: str) -> tuple[str, str, str] | None:
         sermon = '_'.join(parts[1:analysis_start_idx])
         analysis = '_'.join(parts[analysis_start_idx:])
 
-    return theologian, sermon, analysis
+    # Interned: these are repeated across files and used as grouping keys
+    return sys.intern(theologian), sys.intern(sermon), sys.intern(analysis)
+
+
+# Metaphor coherence status -> score
+COHERENCE_SCORES = {'FULLY_COHERENT': 10, 'MOSTLY_COHERENT': 8, 'COHERENT': 7,
+                    'PARTIALLY_COHERENT': 5, 'INCOHERENT': 2}
+
+# Criterion key prefixes of the two esthetiek domains (e.g. criterion_a1_imagery)
+_CRITERION_A_RE = re.compile(r'criterion_a\d+_')
+_CRITERION_B_RE = re.compile(r'criterion_b\d+_')
+
+# Speech act verb categories (JSON key, label)
+VERB_CATEGORIES = (('assertieven', 'Assertives'), ('directieven', 'Directives'),
+                   ('expressieven', 'Expressives'), ('commissieven', 'Commissives'),
+                   ('declaratieven', 'Declaratives'))
+
+# Narrative modal analysis keys (JSON key, label)
+MODAL_CATEGORIES = (('devoir_faire', 'Devoir'), ('vouloir_faire', 'Vouloir'),
+                    ('savoir_faire', 'Savoir'), ('pouvoir_faire', 'Pouvoir'))
+
+# Which mode a score path belongs to
+BOTH, SUMMARY_ONLY, DETAILED_ONLY = None, False, True
+
+# Scores read directly from a key path: (metric name, key path, mode).
+# A score is taken if the value at the path is truthy (and then validated by add_score).
+SCORE_PATHS = {
+    'aristoteles': (
+        ('Logos', ('aristotelian_modes_analysis', 'logos', 'score'), BOTH),
+        ('Pathos', ('aristotelian_modes_analysis', 'pathos', 'score'), BOTH),
+        ('Ethos', ('aristotelian_modes_analysis', 'ethos', 'score'), BOTH),
+        ('Overall', ('overall_picture', 'overall_rhetorical_score'), BOTH),
+        ('Balance Score', ('rhetorical_balance_analysis', 'balance_score'), DETAILED_ONLY),
+    ),
+    'kolb': (
+        ('Concrete Experience', ('kolb_phases_analysis', 'phase_1_concrete_experience', 'score'), BOTH),
+        ('Reflective Observation', ('kolb_phases_analysis', 'phase_2_reflective_observation', 'score'), BOTH),
+        ('Abstract Conceptualization', ('kolb_phases_analysis', 'phase_3_abstract_conceptualization', 'score'), BOTH),
+        ('Active Experimentation', ('kolb_phases_analysis', 'phase_4_active_experimentation', 'score'), BOTH),
+        # Learning styles
+        ('Dreamer', ('learning_styles_analysis', 'dreamer', 'score'), DETAILED_ONLY),
+        ('Thinker', ('learning_styles_analysis', 'thinker', 'score'), DETAILED_ONLY),
+        ('Doer', ('learning_styles_analysis', 'doer', 'score'), DETAILED_ONLY),
+        ('Decider', ('learning_styles_analysis', 'decider', 'score'), DETAILED_ONLY),
+        # Also check alternative key names
+        ('Assimilating', ('learning_styles_analysis', 'assimilating_style', 'score'), DETAILED_ONLY),
+        ('Converging', ('learning_styles_analysis', 'converging_style', 'score'), DETAILED_ONLY),
+        ('Accommodating', ('learning_styles_analysis', 'accommodating_style', 'score'), DETAILED_ONLY),
+        ('Diverging', ('learning_styles_analysis', 'diverging_style', 'score'), DETAILED_ONLY),
+        # Integrality metrics
+        ('Cycle Completeness', ('integrality_and_cycle', 'cycle_completeness', 'score'), DETAILED_ONLY),
+        ('Balance Between Phases', ('integrality_and_cycle', 'balance_between_phases', 'score'), DETAILED_ONLY),
+        ('Holistic Learning', ('integrality_and_cycle', 'holistic_learning', 'score'), DETAILED_ONLY),
+        ('Overall', ('overall_picture', 'overall_kolb_score'), BOTH),
+    ),
+    'schulz_von_thun': (
+        ('Factual Content', ('schulz_von_thun_analysis', 'factual_content_blue', 'score'), BOTH),
+        ('Self-Revelation', ('schulz_von_thun_analysis', 'self_revelation_green', 'score'), BOTH),
+        ('Relational Aspect', ('schulz_von_thun_analysis', 'relational_aspect_yellow', 'score'), BOTH),
+        ('Appeal Aspect', ('schulz_von_thun_analysis', 'appeal_aspect_red', 'score'), BOTH),
+        ('Overall', ('overall_picture', 'overall_communication_score'), BOTH),
+    ),
+    'esthetiek': (
+        # Anti-kitsch and Space for Grace
+        ('Anti-Kitsch', ('kitsch_diagnosis', 'anti_kitsch_score'), DETAILED_ONLY),
+        ('Space for Grace', ('space_for_grace_analysis', 'space_score'), DETAILED_ONLY),
+        # Summary scores only
+        ('Poetics', ('domain_a_poetics_of_language', 'average_score_language'), SUMMARY_ONLY),
+        ('Dramaturgy', ('domain_b_dramaturgy_of_structure', 'average_score_structure'), SUMMARY_ONLY),
+        ('Overall', ('overall_aesthetics', 'overall_aesthetic_score'), BOTH),
+    ),
+    'transactional': (
+        # Ego positions scan
+        ('Freedom from Critical Parent', ('ego_positions_scan', 'parent', 'freedom_from_critical_parent_CP', 'score'), BOTH),
+        ('Nurturing Parent', ('ego_positions_scan', 'parent', 'healthy_care_NP', 'score'), BOTH),
+        ('Adult Presence', ('ego_positions_scan', 'adult', 'score'), BOTH),
+        ('Freedom from Adapted Child', ('ego_positions_scan', 'child', 'freedom_from_adapted_child_AC', 'score'), BOTH),
+        ('Free Child', ('ego_positions_scan', 'child', 'free_child_FC', 'score'), BOTH),
+        # Transaction analysis
+        ('Communicative Purity', ('transaction_analysis', 'communicative_purity_score'), BOTH),
+        # Overall psychological health score
+        ('Overall', ('conclusion_and_recommendation', 'psychological_health_score'), BOTH),
+    ),
+    'speech_act': (
+        # Diagnostic evaluation scores
+        ('Event Score', ('diagnostische_evaluatie', 'gebeuren_score'), BOTH),
+        ('Sacramental Power', ('diagnostische_evaluatie', 'sacramentele_kracht'), BOTH),
+        # Illocution clarity score
+        ('Illocution Clarity', ('drievoudige_structuur_analyse', 'illocutie', 'helderheid_score'), BOTH),
+    ),
+}
 
 
-def extract_scores(data: dict, analysis_type: str, detailed: bool = False) -> dict[str, float]:
-    """
-    Extract scores from analysis data based on the analysis type.
-    Returns a dictionary of {metric_name: score}.
-    """
-    scores = {}
+# Shared default for absent sections in .get() chains; only ever read, never mutated
+_EMPTY: dict = {}
 
-    # Skip if data is not a dict (malformed JSON)
-    if not isinstance(data, dict):
-        return scores
 
-    def add_score(category: str, value):
-        """Add a score if it's a valid number between 0 and 10."""
-        if isinstance(value, (int, float)) and 0 <= value <= 10:
-            key = f"{analysis_type}_{category}"
-            scores[key] = value
+def _walk(data: Any, path: tuple[str, ...]) -> Any:
+    """Follow a key path through nested dicts; returns None if any step is absent."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
 
-    if analysis_type == 'aristoteles':
-        modes = data.get('aristotelian_modes_analysis', {})
-        if modes.get('logos', {}).get('score'):
-            add_score('Logos', modes['logos']['score'])
-        if modes.get('pathos', {}).get('score'):
-            add_score('Pathos', modes['pathos']['score'])
-        if modes.get('ethos', {}).get('score'):
-            add_score('Ethos', modes['ethos']['score'])
-        if data.get('overall_picture', {}).get('overall_rhetorical_score'):
-            add_score('Overall', data['overall_picture']['overall_rhetorical_score'])
-        if detailed and data.get('rhetorical_balance_analysis', {}).get('balance_score'):
-            add_score('Balance Score', data['rhetorical_balance_analysis']['balance_score'])
-
-    elif analysis_type == 'dekker':
-        criteria = data.get('analysis_per_criterion', {})
-        for key, value in criteria.items():
-            if isinstance(value, dict) and value.get('score_1_to_10'):
-                # Normalize common typos in criterion names
-                normalized_key = key.replace('concrete_concrete', 'concrete')
-
-                # Format: criterion_1_specific_bible_passage -> #1 specific bible passage
-                name = normalized_key.replace('criterion_', '').replace('_', ' ')
-                # Add # before the number at the start
-                parts = name.split(' ', 1)
-                if parts[0].isdigit():
-                    name = f"#{parts[0]} {parts[1]}" if len(parts) > 1 else f"#{parts[0]}"
-                add_score(name, value['score_1_to_10'])
-
-    elif analysis_type == 'kolb':
-        phases = data.get('kolb_phases_analysis', {})
-        if phases.get('phase_1_concrete_experience', {}).get('score'):
-            add_score('Concrete Experience', phases['phase_1_concrete_experience']['score'])
-        if phases.get('phase_2_reflective_observation', {}).get('score'):
-            add_score('Reflective Observation', phases['phase_2_reflective_observation']['score'])
-        if phases.get('phase_3_abstract_conceptualization', {}).get('score'):
-            add_score('Abstract Conceptualization', phases['phase_3_abstract_conceptualization']['score'])
-        if phases.get('phase_4_active_experimentation', {}).get('score'):
-            add_score('Active Experimentation', phases['phase_4_active_experimentation']['score'])
-
-        if detailed:
-            # Learning styles
-            styles = data.get('learning_styles_analysis', {})
-            if styles.get('dreamer', {}).get('score'):
-                add_score('Dreamer', styles['dreamer']['score'])
-            if styles.get('thinker', {}).get('score'):
-                add_score('Thinker', styles['thinker']['score'])
-            if styles.get('doer', {}).get('score'):
-                add_score('Doer', styles['doer']['score'])
-            if styles.get('decider', {}).get('score'):
-                add_score('Decider', styles['decider']['score'])
-
-            # Also check alternative key names
-            if styles.get('assimilating_style', {}).get('score'):
-                add_score('Assimilating', styles['assimilating_style']['score'])
-            if styles.get('converging_style', {}).get('score'):
-                add_score('Converging', styles['converging_style']['score'])
-            if styles.get('accommodating_style', {}).get('score'):
-                add_score('Accommodating', styles['accommodating_style']['score'])
-            if styles.get('diverging_style', {}).get('score'):
-                add_score('Diverging', styles['diverging_style']['score'])
-
-            # Integrality metrics
-            integ = data.get('integrality_and_cycle', {})
-            if integ.get('cycle_completeness', {}).get('score'):
-                add_score('Cycle Completeness', integ['cycle_completeness']['score'])
-            if integ.get('balance_between_phases', {}).get('score'):
-                add_score('Balance Between Phases', integ['balance_between_phases']['score'])
-            if integ.get('holistic_learning', {}).get('score'):
-                add_score('Holistic Learning', integ['holistic_learning']['score'])
-
-        if data.get('overall_picture', {}).get('overall_kolb_score'):
-            add_score('Overall', data['overall_picture']['overall_kolb_score'])
-
-    elif analysis_type == 'schulz_von_thun':
-        analysis = data.get('schulz_von_thun_analysis', {})
-        if analysis.get('factual_content_blue', {}).get('score'):
-            add_score('Factual Content', analysis['factual_content_blue']['score'])
-        if analysis.get('self_revelation_green', {}).get('score'):
-            add_score('Self-Revelation', analysis['self_revelation_green']['score'])
-        if analysis.get('relational_aspect_yellow', {}).get('score'):
-            add_score('Relational Aspect', analysis['relational_aspect_yellow']['score'])
-        if analysis.get('appeal_aspect_red', {}).get('score'):
-            add_score('Appeal Aspect', analysis['appeal_aspect_red']['score'])
-        if data.get('overall_picture', {}).get('overall_communication_score'):
-            add_score('Overall', data['overall_picture']['overall_communication_score'])
-
-    elif analysis_type == 'esthetiek':
-        if detailed:
-            # Domain A - Poetics of Language (all individual criteria)
-            dom_a = data.get('domain_a_poetics_of_language', {})
-            for key, value in dom_a.items():
-                if isinstance(value, dict) and value.get('score') is not None:
-                    # Format: criterion_a1_imagery -> Imagery
-                    import re
-                    name = re.sub(r'criterion_a\d+_', '', key).replace('_', ' ')
-                    name = name.title()
-                    add_score(name, value['score'])
-
-            # Domain B - Dramaturgy of Structure (all individual criteria)
-            dom_b = data.get('domain_b_dramaturgy_of_structure', {})
-            for key, value in dom_b.items():
-                if isinstance(value, dict) and value.get('score') is not None:
-                    import re
-                    name = re.sub(r'criterion_b\d+_', '', key).replace('_', ' ')
-                    name = name.title()
-                    add_score(name, value['score'])
-
-            # Anti-kitsch and Space for Grace
-            if data.get('kitsch_diagnosis', {}).get('anti_kitsch_score'):
-                add_score('Anti-Kitsch', data['kitsch_diagnosis']['anti_kitsch_score'])
-            if data.get('space_for_grace_analysis', {}).get('space_score'):
-                add_score('Space for Grace', data['space_for_grace_analysis']['space_score'])
-        else:
-            # Summary scores only
-            if data.get('domain_a_poetics_of_language', {}).get('average_score_language'):
-                add_score('Poetics', data['domain_a_poetics_of_language']['average_score_language'])
-            if data.get('domain_b_dramaturgy_of_structure', {}).get('average_score_structure'):
-                add_score('Dramaturgy', data['domain_b_dramaturgy_of_structure']['average_score_structure'])
-
-        if data.get('overall_aesthetics', {}).get('overall_aesthetic_score'):
-            add_score('Overall', data['overall_aesthetics']['overall_aesthetic_score'])
-
-    elif analysis_type == 'transactional':
-        # Ego positions scan
-        ego_scan = data.get('ego_positions_scan', {})
-        parent = ego_scan.get('parent', {})
-        child = ego_scan.get('child', {})
-        adult = ego_scan.get('adult', {})
-
-        if parent.get('freedom_from_critical_parent_CP', {}).get('score'):
-            add_score('Freedom from Critical Parent', parent['freedom_from_critical_parent_CP']['score'])
-        if parent.get('healthy_care_NP', {}).get('score'):
-            add_score('Nurturing Parent', parent['healthy_care_NP']['score'])
-        if adult.get('score'):
-            add_score('Adult Presence', adult['score'])
-        if child.get('freedom_from_adapted_child_AC', {}).get('score'):
-            add_score('Freedom from Adapted Child', child['freedom_from_adapted_child_AC']['score'])
-        if child.get('free_child_FC', {}).get('score'):
-            add_score('Free Child', child['free_child_FC']['score'])
 
-        # Transaction analysis
-        trans = data.get('transaction_analysis', {})
-        if trans.get('communicative_purity_score'):
-            add_score('Communicative Purity', trans['communicative_purity_score'])
+def _dekker_scores(data: dict, detailed: bool, add_score: Callable[[str, Any], None]):
+    """One score per dekker criterion."""
+    criteria = data.get('analysis_per_criterion', _EMPTY)
+    for key, value in criteria.items():
+        if isinstance(value, dict) and value.get('score_1_to_10'):
+            # Normalize common typos in criterion names
+            normalized_key = key.replace('concrete_concrete', 'concrete')
 
-        # Overall psychological health score
-        conclusion = data.get('conclusion_and_recommendation', {})
-        if conclusion.get('psychological_health_score'):
-            add_score('Overall', conclusion['psychological_health_score'])
+            # Format: criterion_1_specific_bible_passage -> #1 specific bible passage
+            name = normalized_key.replace('criterion_', '').replace('_', ' ')
+            # Add # before the number at the start
+            parts = name.split(' ', 1)
+            if parts[0].isdigit():
+                name = f"#{parts[0]} {parts[1]}" if len(parts) > 1 else f"#{parts[0]}"
+            add_score(name, value['score_1_to_10'])
 
-    elif analysis_type == 'speech_act':
-        # Diagnostic evaluation scores
-        diag = data.get('diagnostische_evaluatie', {})
-        if diag.get('gebeuren_score'):
-            add_score('Event Score', diag['gebeuren_score'])
-        if diag.get('sacramentele_kracht'):
-            add_score('Sacramental Power', diag['sacramentele_kracht'])
 
-        # Illocution clarity score
-        structuur = data.get('drievoudige_structuur_analyse', {})
-        if structuur.get('illocutie', {}).get('helderheid_score'):
-            add_score('Illocution Clarity', structuur['illocutie']['helderheid_score'])
-
-        if detailed:
-            # Werkwoord analysis percentages (convert to 0-10 scale)
-            werkwoord = data.get('werkwoord_analyse', {})
-            for cat_key, cat_label in [('assertieven', 'Assertives'), ('directieven', 'Directives'),
-                                        ('expressieven', 'Expressives'), ('commissieven', 'Commissives'),
-                                        ('declaratieven', 'Declaratives')]:
-                cat_data = werkwoord.get(cat_key, {})
-                if cat_data.get('procent'):
-                    # Convert percentage string to score (e.g., "60%" -> 6.0)
-                    pct_str = str(cat_data['procent']).replace('%', '')
-                    try:
-                        pct_val = float(pct_str) / 10  # Convert to 0-10 scale
-                        if 0 <= pct_val <= 10:
-                            add_score(cat_label, pct_val)
-                    except ValueError:
-                        pass
-
-    elif analysis_type == 'metaphor':
-        # Coherence analysis
-        diag = data.get('diagnostische_evaluatie', {})
-        coherence = diag.get('coherentie_analyse', {})
-        coherence_status = coherence.get('overall_coherentie', '')
-        # Map coherence status to score
-        coherence_map = {'FULLY_COHERENT': 10, 'MOSTLY_COHERENT': 8, 'COHERENT': 7,
-                         'PARTIALLY_COHERENT': 5, 'INCOHERENT': 2}
-        if coherence_status in coherence_map:
-            add_score('Coherence', coherence_map[coherence_status])
-
-        if detailed:
-            # Dominant domains prominence scores
-            primair = data.get('primaire_analyse', {})
-            for i, domein in enumerate(primair.get('dominante_domeinen', [])[:3]):
-                if domein.get('prominentie_score'):
-                    try:
-                        score = int(domein['prominentie_score'])
-                        if 0 <= score <= 10:
-                            add_score(f"Domain {i+1} Prominence", score)
-                    except ValueError:
-                        pass
-
-    elif analysis_type == 'narrative':
-        # Rutledge score (God vs. human as subject)
-        gramm = data.get('grammaticale_analyse', {})
-        subject_check = gramm.get('subject_check', {})
-        if subject_check.get('rutledge_score'):
-            try:
-                score = int(subject_check['rutledge_score'])
-                if 0 <= score <= 10:
-                    add_score('Rutledge Score', score)
-            except ValueError:
-                pass
+def _esthetiek_criterion_scores(data: dict, detailed: bool, add_score: Callable[[str, Any], None]):
+    """Every individual criterion of both esthetiek domains (detailed mode only)."""
+    if not detailed:
+        return
+
+    # Domain A - Poetics of Language (all individual criteria)
+    dom_a = data.get('domain_a_poetics_of_language', _EMPTY)
+    for key, value in dom_a.items():
+        if isinstance(value, dict) and value.get('score') is not None:
+            # Format: criterion_a1_imagery -> Imagery
+            name = _CRITERION_A_RE.sub('', key).replace('_', ' ')
+            name = name.title()
+            add_score(name, value['score'])
+
+    # Domain B - Dramaturgy of Structure (all individual criteria)
+    dom_b = data.get('domain_b_dramaturgy_of_structure', _EMPTY)
+    for key, value in dom_b.items():
+        if isinstance(value, dict) and value.get('score') is not None:
+            name = _CRITERION_B_RE.sub('', key).replace('_', ' ')
+            name = name.title()
+            add_score(name, value['score'])
+
+
+def _speech_act_verb_scores(data: dict, detailed: bool, add_score: Callable[[str, Any], None]):
+    """Werkwoord analysis percentages on a 0-10 scale (detailed mode only)."""
+    if not detailed:
+        return
 
-        # Subject frequency score
-        actant = data.get('actantiele_analyse', {})
-        primair = actant.get('primair_narratief_programma', {})
-        if primair.get('subject', {}).get('frequentie_score'):
+    werkwoord = data.get('werkwoord_analyse', _EMPTY)
+    for cat_key, cat_label in VERB_CATEGORIES:
+        cat_data = werkwoord.get(cat_key, _EMPTY)
+        if cat_data.get('procent'):
+            # Convert percentage string to score (e.g., "60%" -> 6.0)
+            pct_str = str(cat_data['procent']).replace('%', '')
             try:
-                score = int(primair['subject']['frequentie_score'])
-                if 0 <= score <= 10:
-                    add_score('Subject Frequency', score)
+                pct_val = float(pct_str) / 10  # Convert to 0-10 scale
+                if 0 <= pct_val <= 10:
+                    add_score(cat_label, pct_val)
             except ValueError:
                 pass
 
-        if detailed:
-            # Modal analysis prominences
-            modale = gramm.get('modale_analyse', {})
-            for mod_key, mod_label in [('devoir_faire', 'Devoir'), ('vouloir_faire', 'Vouloir'),
-                                        ('savoir_faire', 'Savoir'), ('pouvoir_faire', 'Pouvoir')]:
-                mod_data = modale.get(mod_key, {})
-                if mod_data.get('prominentie'):
-                    try:
-                        score = int(mod_data['prominentie'])
-                        if 0 <= score <= 10:
-                            add_score(mod_label, score)
-                    except ValueError:
-                        pass
 
-    return scores
+def _metaphor_scores(data: dict, detailed: bool, add_score: Callable[[str, Any], None]):
+    """Coherence status mapped to a score, plus dominant domain prominence (detailed)."""
+    # Coherence analysis
+    diag = data.get('diagnostische_evaluatie', _EMPTY)
+    coherence = diag.get('coherentie_analyse', _EMPTY)
+    coherence_status = coherence.get('overall_coherentie', '')
+    # Map coherence status to score
+    if coherence_status in COHERENCE_SCORES:
+        add_score('Coherence', COHERENCE_SCORES[coherence_status])
+
+    if detailed:
+        # Dominant domains prominence scores
+        primair = data.get('primaire_analyse', _EMPTY)
+        for i, domein in enumerate(primair.get('dominante_domeinen', ())[:3]):
+            if domein.get('prominentie_score'):
+                try:
+                    score = int(domein['prominentie_score'])
+                    if 0 <= score <= 10:
+                        add_score(f"Domain {i+1} Prominence", score)
+                except ValueError:
+                    pass
+
+
+def _narrative_scores(data: dict, detailed: bool, add_score: Callable[[str, Any], None]):
+    """Integer-valued narrative scores, plus modal prominences (detailed)."""
+    # Rutledge score (God vs. human as subject)
+    gramm = data.get('grammaticale_analyse', _EMPTY)
+    subject_check = gramm.get('subject_check', _EMPTY)
+    if subject_check.get('rutledge_score'):
+        try:
+            score = int(subject_check['rutledge_score'])
+            if 0 <= score <= 10:
+                add_score('Rutledge Score', score)
+        except ValueError:
+            pass
+
+    # Subject frequency score
+    actant = data.get('actantiele_analyse', _EMPTY)
+    primair = actant.get('primair_narratief_programma', _EMPTY)
+    if primair.get('subject', _EMPTY).get('frequentie_score'):
+        try:
+            score = int(primair['subject']['frequentie_score'])
+            if 0 <= score <= 10:
+                add_score('Subject Frequency', score)
+        except ValueError:
+            pass
+
+    if detailed:
+        # Modal analysis prominences
+        modale = gramm.get('modale_analyse', _EMPTY)
+        for mod_key, mod_label in MODAL_CATEGORIES:
+            mod_data = modale.get(mod_key, _EMPTY)
+            if mod_data.get('prominentie'):
+                try:
+                    score = int(mod_data['prominentie'])
+                    if 0 <= score <= 10:
+                        add_score(mod_label, score)
+                except ValueError:
+                    pass
+
+
+# Extraction steps per analysis type, run in order: either a SCORE_PATHS table or a
+# function called as step(data, detailed, add_score) for scores that need more than
+# a key path. The order fixes the order of the metric keys in the output.
+SCORE_EXTRACTORS = {
+    'aristoteles': (SCORE_PATHS['aristoteles'],),
+    'dekker': (_dekker_scores,),
+    'kolb': (SCORE_PATHS['kolb'],),
+    'schulz_von_thun': (SCORE_PATHS['schulz_von_thun'],),
+    'esthetiek': (_esthetiek_criterion_scores, SCORE_PATHS['esthetiek']),
+    'transactional': (SCORE_PATHS['transactional'],),
+    'speech_act': (SCORE_PATHS['speech_act'], _speech_act_verb_scores),
+    'metaphor': (_metaphor_scores,),
+    'narrative': (_narrative_scores,),
+}
+
+
+def _score_adder(scores: dict, analysis_type: str) -> Callable[[str, Any], None]:
+    """Return an add_score(category, value) function that stores into scores."""
+    def add_score(category: str, value):
+        """Add a score if it's a valid number between 0 and 10."""
+        if isinstance(value, (int, float)) and 0 <= value <= 10:
+            # Interned: the same few hundred metric keys recur in every file
+            key = sys.intern(f"{analysis_type}_{category}")
+            scores[key] = value
+    return add_score
+
+
+def extract_scores(data: dict, analysis_type: str) -> tuple[dict[str, float], dict[str, float]]:
+    """
+    Extract scores from analysis data based on the analysis type, for both
+    the summary and the detailed view in one pass over the document.
+    Returns two dictionaries of {metric_name: score}: (summary, detailed).
+    """
+    summary_scores = {}
+    detailed_scores = {}
+
+    # Skip if data is not a dict (malformed JSON)
+    if not isinstance(data, dict):
+        return summary_scores, detailed_scores
+
+    add_summary_score = _score_adder(summary_scores, analysis_type)
+    add_detailed_score = _score_adder(detailed_scores, analysis_type)
+
+    for step in SCORE_EXTRACTORS.get(analysis_type, ()):
+        if callable(step):
+            step(data, False, add_summary_score)
+            step(data, True, add_detailed_score)
+            continue
+        # Key paths are walked once and the score goes to each view it belongs to
+        for name, path, mode in step:
+            value = _walk(data, path)
+            if value:
+                if mode is not DETAILED_ONLY:
+                    add_summary_score(name, value)
+                if mode is not SUMMARY_ONLY:
+                    add_detailed_score(name, value)
+
+    return summary_scores, detailed_scores
 
 
 def calculate_violin_data(values: list[float]) -> dict:
@@ -374,7 +416,7 @@ def calculate_violin_data(values: list[float]) -> dict:
 
 def aggregate_scores(all_data: list[dict], detailed: bool = False) -> dict:
     """
-    Aggregate scores from all analysis data for violin plot rendering.
+    Aggregate the scores extracted per file (see load_all_data) for violin plot rendering.
 
     Returns a nested dictionary:
     {
@@ -386,12 +428,10 @@ def aggregate_scores(all_data: list[dict], detailed: bool = False) -> dict:
     # Collect scores per theologian per metric
     scores_by_metric_and_theologian = defaultdict(lambda: defaultdict(list))
 
+    scores_field = 'detailed_scores' if detailed else 'summary_scores'
     for item in all_data:
         theologian = item['theologian']
-        analysis_type = item['analysis']
-        data = item['data']
-
-        scores = extract_scores(data, analysis_type, detailed)
+        scores = item[scores_field]
 
         for metric_key, score in scores.items():
             scores_by_metric_and_theologian[metric_key][theologian].append(score)
@@ -431,50 +471,133 @@ def convert_violin_to_statistics(violin_data: dict) -> dict:
     return stats_data
 
 
+def load_json(filepath: str | Path) -> Any:
+    """Parse a JSON file, with orjson when available (it parses the raw bytes directly)."""
+    with open(filepath, 'rb') as f:
+        if orjson is not None and 0 < MMAP_THRESHOLD <= os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def write_json(obj: Any, filepath: Path):
+    """
+    Write obj as 2-space indented UTF-8 JSON, the same bytes as
+    json.dump(obj, f, indent=2, ensure_ascii=False).
+    """
+    if orjson is not None:
+        try:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+            return
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; json.dump handles them
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def load_scores_cache() -> dict:
+    """
+    Load the scores cache written by the previous run.
+
+    The cache is tagged with a hash of this script, so any change to the
+    extraction code invalidates it.
+    Returns {filename: (mtime_ns, size, (summary_scores, detailed_scores))}.
+    """
+    if SCORES_CACHE_FILE is None or not SCORES_CACHE_FILE.exists():
+        return {}
+    try:
+        with open(SCORES_CACHE_FILE, 'rb') as f:
+            tag, entries = pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return {}
+    return entries if tag == _cache_tag() else {}
+
+
+def save_scores_cache(entries: dict):
+    """Write the scores cache atomically (a partial write is never read back)."""
+    if SCORES_CACHE_FILE is None:
+        return
+    SCORES_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = SCORES_CACHE_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'wb') as f:
+        pickle.dump((_cache_tag(), entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, SCORES_CACHE_FILE)
+
+
+def _cache_tag() -> str:
+    return hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+
 def load_all_data() -> list[dict]:
-    """Load all JSON analysis files from the docs directory."""
+    """
+    Load all JSON analysis files from the docs directory and extract their
+    summary and detailed scores. Files that are unchanged since the previous
+    run are taken from the scores cache without being opened.
+    """
     all_data = []
 
     if not INPUT_DIR.exists():
         print(f"Error: Directory {INPUT_DIR} not found")
         return all_data
 
-    json_files = list(INPUT_DIR.glob("*.json"))
-    print(f"Found {len(json_files)} JSON files in {INPUT_DIR}")
+    with os.scandir(INPUT_DIR) as entries:
+        json_entries = [entry for entry in entries if entry.name.endswith('.json')]
+    print(f"Found {len(json_entries)} JSON files in {INPUT_DIR}")
 
-    for filepath in sorted(json_files):
-        parsed = parse_filename(filepath.name)
+    json_entries.sort(key=lambda entry: entry.name)
+    cache = load_scores_cache()
+    new_cache = {}
+    for dir_entry in json_entries:
+        parsed = parse_filename(dir_entry.name)
         if not parsed:
             continue
 
+        # The entry's own path string (e.g. 'docs/x.json'): no Path object per file
+        filepath = dir_entry.path
+
         theologian, sermon, analysis = parsed
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Handle array JSON files (some files are wrapped in arrays)
-            if isinstance(data, list):
-                if len(data) > 0 and isinstance(data[0], dict):
-                    data = data[0]  # Take first element
-                else:
-                    print(f"Warning: Skipping {filepath} - array with no valid object")
+            stat = dir_entry.stat()
+            entry = cache.get(dir_entry.name)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                summary_scores, detailed_scores = entry[2]
+            else:
+                data = load_json(filepath)
+
+                # Handle array JSON files (some files are wrapped in arrays)
+                if isinstance(data, list):
+                    if len(data) > 0 and isinstance(data[0], dict):
+                        data = data[0]  # Take first element
+                    else:
+                        print(f"Warning: Skipping {filepath} - array with no valid object")
+                        continue
+
+                # Skip if data is not a dict (malformed structure)
+                if not isinstance(data, dict):
+                    print(f"Warning: Skipping {filepath} - not a valid object")
                     continue
 
-            # Skip if data is not a dict (malformed structure)
-            if not isinstance(data, dict):
-                print(f"Warning: Skipping {filepath} - not a valid object")
-                continue
+                summary_scores, detailed_scores = extract_scores(data, analysis)
+            new_cache[dir_entry.name] = (stat.st_mtime_ns, stat.st_size, (summary_scores, detailed_scores))
 
             all_data.append({
                 'theologian': theologian,
                 'sermon': sermon,
                 'analysis': analysis,
-                'data': data
+                'summary_scores': summary_scores,
+                'detailed_scores': detailed_scores
             })
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Failed to load {filepath}: {e}")
 
+    if new_cache != cache:
+        save_scores_cache(new_cache)
+
     print(f"Successfully loaded {len(all_data)} analysis files")
     return all_data
 
@@ -532,8 +655,7 @@ def main():
     DOCS_DIR.mkdir(exist_ok=True)
 
     # Write violin data output
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    write_json(output, OUTPUT_FILE)
 
     print(f"\nViolin plot data saved to {OUTPUT_FILE}")
 
@@ -550,8 +672,7 @@ def main():
         'detailed': detailed_stats
     }
 
-    with open(STATISTICS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(stats_output, f, indent=2, ensure_ascii=False)
+    write_json(stats_output, STATISTICS_FILE)
 
     print(f"Statistics data saved to {STATISTICS_FILE}")
 
@@ -20,17 +20,79 @@ Output:
 
 import json
 import csv
+import gzip
+import hashlib
+import io
+import mmap
+import os
+import pickle
+import re
+import sys
 from pathlib import Path
 from collections import defaultdict
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+try:
+    import simdjson
+except ImportError:  # simdjson is optional; orjson/json are used instead
+    simdjson = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pyarrow is optional; only needed for PARQUET_FILE
+    pyarrow = None
 
 
 # Configuration
 DOCS_DIR = Path("docs")
 OUTPUT_FILE = Path("data/homiletic_feedback_data.tsv")
+MAX_WORKERS = None  # worker processes for JSON loading (None = all CPUs, 1 = no pool)
+LOAD_CHUNKSIZE = 16  # files handed to a worker per round trip
+# Files at least this large are memory-mapped and parsed in place by orjson;
+# smaller ones are cheaper to read() (mmap setup costs more than copying ~12 KB); 0 = never
+MMAP_THRESHOLD = 1024 * 1024
+# Quote every field by default; csv.QUOTE_MINIMAL only quotes fields containing
+# tabs or quotes (serialize_value already strips newlines) and reads the same in R
+TSV_QUOTING = csv.QUOTE_ALL
+WRITE_BUFFER_SIZE = 1024 * 1024  # bytes buffered before each write to the TSV
+# gzip level (1 = fastest) for a compressed copy written to OUTPUT_FILE + '.gz'
+# instead of the plain TSV; readr::read_tsv and read.delim read it directly; None = plain
+GZIP_LEVEL = None
+# Write list/dict cells as compact JSON ('["a","b"]' instead of '["a", "b"]'),
+# serialized by orjson when available; parses the same but changes the TSV text
+COMPACT_JSON_CELLS = False
+# Optional Parquet copy of the TSV for arrow::read_parquet in R (requires pyarrow),
+# e.g. Path("data/homiletic_feedback_data.parquet"); None = TSV only
+PARQUET_FILE = None
+# Extracted rows per file, reused on the next run while (mtime, size) match (None = no cache)
+EXTRACT_CACHE_FILE = Path("data/.extract_cache.pickle")
+
+# One reusable simdjson parser (keeps its internal buffers between files)
+_SIMDJSON_PARSER = simdjson.Parser() if simdjson is not None else None
 
 # Known analysis types
-ANALYSIS_TYPES = ['aristoteles', 'dekker', 'kolb', 'schulz_von_thun', 'esthetiek', 'transactional', 'metaphor', 'speech_act', 'narrative']
+ANALYSIS_TYPES = ('aristoteles', 'dekker', 'kolb', 'schulz_von_thun', 'esthetiek', 'transactional', 'metaphor', 'speech_act', 'narrative')
+_ANALYSIS_TYPE_SET = frozenset(ANALYSIS_TYPES)
+
+# Special files that are not analyses
+SKIP_PATTERNS = ('statistics', 'violin_data', 'file_index', '.raw')
+_SKIP_RE = re.compile('|'.join(map(re.escape, SKIP_PATTERNS)))
+
+# theologian, then the shortest run of '_token's before the first token that
+# starts a known analysis type, then the analysis type (plus any suffix tokens)
+_FILENAME_RE = re.compile(
+    r'(?P<theologian>[^_]*)(?P<sermon>(?:_[^_]*)*?)_(?P<analysis>(?:'
+    + '|'.join(sorted(ANALYSIS_TYPES, key=len, reverse=True))
+    + r')(?:_.*)?)',
+    re.DOTALL
+)
 
 
 def parse_filename(filename: str) -> tuple[str, str, str] | None:
@@ -41,9 +103,8 @@ def parse_filename(filename: str) -> tuple[str, str, str] | None:
     if not filename.endswith('.json'):
         return None
 
-    # Skip special files and Sölle B (second run) files
-    skip_patterns = ['statistics', 'violin_data', 'file_index', '.raw']
-    if any(pattern in filename for pattern in skip_patterns):
+    # Skip special files
+    if _SKIP_RE.search(filename):
         return None
 
     # Skip Sölle B files (second run on same sermons)
@@ -51,34 +112,92 @@ def parse_filename(filename: str) -> tuple[str, str, str] | None:
         return None
 
     base = filename.replace('.json', '')
-    parts = base.split('_')
-
-    if len(parts) < 3:
+    if base.count('_') < 2:
         return None
 
-    theologian = parts[0]
-
-    # Find where the analysis type starts
-    analysis_start_idx = None
-    for i in range(1, len(parts)):
-        for analysis_type in ANALYSIS_TYPES:
-            analysis_parts = analysis_type.split('_')
-            candidate = '_'.join(parts[i:i + len(analysis_parts)])
-            if candidate == analysis_type:
-                analysis_start_idx = i
-                break
-        if analysis_start_idx is not None:
-            break
-
-    if analysis_start_idx is None or analysis_start_idx < 2:
-        # Fallback
-        sermon_id = parts[1]
-        analysis = '_'.join(parts[2:])
+    match = _FILENAME_RE.fullmatch(base)
+    if match and match['sermon']:
+        theologian, sermon_id, analysis = match['theologian'], match['sermon'][1:], match['analysis']
     else:
-        sermon_id = '_'.join(parts[1:analysis_start_idx])
-        analysis = '_'.join(parts[analysis_start_idx:])
+        # Fallback: no analysis type found, or it directly follows the theologian
+        parts = base.split('_')
+        theologian, sermon_id, analysis = parts[0], parts[1], '_'.join(parts[2:])
+
+    # Interned: these are repeated across files and used as grouping keys
+    return sys.intern(theologian), sys.intern(sermon_id), sys.intern(analysis)
+
 
-    return theologian, sermon_id, analysis
+def load_json(filepath: Path) -> Any:
+    """
+    Parse a JSON file, using simdjson or orjson when available.
+    Both parse the raw bytes directly, skipping the UTF-8 text decode.
+    """
+    with open(filepath, 'rb') as f:
+        if orjson is not None and 0 < MMAP_THRESHOLD <= os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        raw = f.read()
+    if _SIMDJSON_PARSER is not None:
+        try:
+            # recursive=True materializes plain dicts/lists in one call
+            return _SIMDJSON_PARSER.parse(raw, True)
+        except ValueError:
+            pass  # let orjson/json raise a proper JSONDecodeError
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+# Newline scrubbing in one pass: '\n' -> ' ', '\r' removed
+_NEWLINE_TABLE = str.maketrans({'\n': ' ', '\r': None})
+
+
+def _serialize_json(value: list | dict) -> str:
+    """Serialize a list/dict to a single-line JSON string."""
+    if not value:
+        return '[]' if isinstance(value, list) else '{}'
+    # json.dumps escapes control characters inside strings and does not indent,
+    # so the output never contains a raw newline that would need scrubbing
+    if COMPACT_JSON_CELLS:
+        if orjson is not None:
+            try:
+                return orjson.dumps(value).decode('utf-8')
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; json.dumps handles them
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _serialize_text(value: Any) -> str:
+    """Serialize a scalar to a string without newlines."""
+    text = str(value)
+    # str.translate rebuilds the string codepoint by codepoint, while 'in' is a
+    # memchr scan; almost no text fields contain newlines, so check first
+    if '\n' in text or '\r' in text:
+        return text.translate(_NEWLINE_TABLE)
+    return text
+
+
+def _serialize_none(value: None) -> str:
+    """Missing values become empty cells."""
+    return ""
+
+
+def _serialize_bool(value: bool) -> str:
+    """Booleans use R's logical literals."""
+    return "TRUE" if value else "FALSE"
+
+
+# Serializers keyed by exact type; subclasses fall through to the isinstance checks
+_SERIALIZERS: dict[type, Callable[[Any], str]] = {
+    type(None): _serialize_none,
+    list: _serialize_json,
+    dict: _serialize_json,
+    bool: _serialize_bool,
+    int: str,
+    float: str,
+    str: _serialize_text,
+}
 
 
 def serialize_value(value: Any) -> str:
@@ -87,19 +206,18 @@ def serialize_value(value: Any) -> str:
     Lists and dicts are converted to JSON strings.
     Newlines are replaced with spaces to prevent TSV corruption.
     """
-    if value is None:
-        return ""
+    serializer = _SERIALIZERS.get(type(value))
+    if serializer is not None:
+        return serializer(value)
     elif isinstance(value, (list, dict)):
-        json_str = json.dumps(value, ensure_ascii=False)
-        # Replace newlines in JSON strings
-        return json_str.replace('\n', ' ').replace('\r', '')
+        return _serialize_json(value)
     elif isinstance(value, bool):
         return "TRUE" if value else "FALSE"
     elif isinstance(value, (int, float)):
         return str(value)
     else:
         # Replace newlines in regular strings
-        return str(value).replace('\n', ' ').replace('\r', '')
+        return _serialize_text(value)
 
 
 def flatten_dict(data: dict, parent_key: str = '', sep: str = '.') -> dict:
@@ -109,18 +227,510 @@ def flatten_dict(data: dict, parent_key: str = '', sep: str = '.') -> dict:
     Example:
         {'a': {'b': 1, 'c': 2}} -> {'a.b': 1, 'a.c': 2}
     """
-    items = []
+    flat = {}
     for k, v in data.items():
         new_key = f"{parent_key}{sep}{k}" if parent_key else k
 
         if isinstance(v, dict) and not any(isinstance(vv, (list, dict)) for vv in v.values()):
-            # If dict contains only simple values, flatten it
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
+            # If dict contains only simple values, flatten it in place
+            # (its values are never dicts, so one level is all there is to flatten)
+            for kk, vv in v.items():
+                flat[f"{new_key}{sep}{kk}" if new_key else kk] = vv
         else:
             # Otherwise keep the value as is (will be serialized later)
-            items.append((new_key, v))
+            flat[new_key] = v
+
+    return flat
+
+
+# Field kinds for the extraction schemas:
+#   'raw'  - copy the value as is (missing -> '')
+#   'text' - serialize_value(value) (missing -> '')
+#   'list' - serialize_value(value) (missing -> [] -> '[]')
+#   'dict' - serialize_value(value) (missing -> {} -> '{}')
+# Cells written for missing keys, i.e. serialize_value() of each kind's default
+_KIND_DEFAULTS = {'raw': '', 'text': '', 'list': '[]', 'dict': '{}'}
+
+# Cells for empty values, by exact type, so they skip serialize_value()
+_EMPTY_CELLS = {str: '', type(None): '', list: '[]', dict: '{}'}
+
+_SCORED_QUOTES = [('score', 'score', 'raw'), ('analysis', 'analysis', 'text'), ('quotes', 'quotes', 'list')]
+_SCORED_ANALYSIS = [('score', 'score', 'raw'), ('analysis', 'analysis', 'text')]
+_TOP_3 = [('summary', 'summary', 'text'), ('strengths_top_3', 'strengths_top_3', 'list'),
+          ('improvement_points_top_3', 'improvement_points_top_3', 'list')]
+_ARISTOTELES_MODE = [
+    ('score', 'score', 'raw'),
+    ('analysis', 'analysis', 'text'),
+    ('quotes', 'quotes', 'list'),
+    ('strengths', 'strengths', 'list'),
+    ('improvement_points', 'improvement_points', 'list'),
+    ('specific_diagnosis', 'specific_diagnosis', 'text'),
+]
+
+# Declarative extraction schemas per analysis type.
+# Each section is (column_prefix, json_path, required, fields) and each field is
+# (column_suffix, key_path, kind); paths are dotted, columns are 'prefix.suffix'.
+# A required section is skipped entirely when its json_path is absent; otherwise
+# missing values fall back to the kind's default.
+# Keys that vary per file (dekker/esthetiek criteria, metadata) and derived values
+# are handled by the functions in _EXTRA_EXTRACTORS.
+EXTRACTION_SCHEMAS = {
+    'aristoteles': [
+        ('aristoteles.logos', 'aristotelian_modes_analysis.logos', True, _ARISTOTELES_MODE),
+        ('aristoteles.pathos', 'aristotelian_modes_analysis.pathos', True,
+         _ARISTOTELES_MODE + [('emotional_tone', 'emotional_tone', 'text')]),
+        ('aristoteles.ethos', 'aristotelian_modes_analysis.ethos', True,
+         _ARISTOTELES_MODE + [('authenticity', 'authenticity', 'text')]),
+        ('aristoteles.balance', 'rhetorical_balance_analysis', False, [
+            ('dominant_mode', 'dominant_mode', 'text'),
+            ('suppressed_mode', 'suppressed_mode', 'text'),
+            ('balance_score', 'balance_score', 'raw'),
+            ('analysis', 'analysis', 'text'),
+            ('consequences_of_imbalance', 'consequences_of_imbalance', 'list'),
+            ('recommendation_for_balance', 'recommendation_for_balance', 'text'),
+        ]),
+        ('aristoteles.orthodoxy_logos', 'orthodoxy_orthopathy_orthopraxy.orthodoxy_logos', True, _SCORED_ANALYSIS),
+        ('aristoteles.orthopathy_pathos', 'orthodoxy_orthopathy_orthopraxy.orthopathy_pathos', True, _SCORED_ANALYSIS),
+        ('aristoteles.orthopraxy_ethos', 'orthodoxy_orthopathy_orthopraxy.orthopraxy_ethos', True, _SCORED_ANALYSIS),
+        ('aristoteles.overall', 'overall_picture', False, [
+            ('overall_rhetorical_score', 'overall_rhetorical_score', 'raw'),
+            *_TOP_3,
+            ('primary_rhetorical_style', 'primary_rhetorical_style', 'text'),
+            ('audience_analysis', 'audience_analysis', 'text'),
+            ('recommendations_for_next_sermon', 'recommendations_for_next_sermon', 'list'),
+            ('conclusion', 'conclusion', 'text'),
+        ]),
+    ],
+    'dekker': [
+        ('dekker.overall', 'overall_dekker_analysis', False, [
+            ('strengths', 'strengths', 'list'),
+            ('weaknesses', 'weaknesses', 'list'),
+            ('general_recommendation', 'general_recommendation', 'text'),
+        ]),
+    ],
+    'kolb': [
+        *[(f'kolb.{phase_name}', f'kolb_phases_analysis.{phase_key}', True, [
+            ('score', 'score', 'raw'),
+            ('analysis', 'analysis', 'text'),
+            ('quotes', 'quotes', 'list'),
+            ('strengths', 'strengths', 'list'),
+            ('improvement_points', 'improvement_points', 'list'),
+            ('homiletical_manifestations', 'homiletical_manifestations', 'text'),
+        ]) for phase_key, phase_name in [
+            ('phase_1_concrete_experience', 'concrete_experience'),
+            ('phase_2_reflective_observation', 'reflective_observation'),
+            ('phase_3_abstract_conceptualization', 'abstract_conceptualization'),
+            ('phase_4_active_experimentation', 'active_experimentation'),
+        ]],
+        *[(f'kolb.learning_style.{style}', f'learning_styles_analysis.{style}', True, _SCORED_ANALYSIS)
+          for style in ['dreamer', 'thinker', 'doer', 'decider']],
+        *[(f'kolb.integrality.{key}', f'integrality_and_cycle.{key}', True, _SCORED_ANALYSIS)
+          for key in ['cycle_completeness', 'balance_between_phases', 'holistic_learning']],
+        ('kolb.overall', 'overall_picture', False, [
+            ('overall_kolb_score', 'overall_kolb_score', 'raw'),
+            *_TOP_3,
+        ]),
+    ],
+    'schulz_von_thun': [
+        *[(f'schulz.{aspect_name}', f'schulz_von_thun_analysis.{aspect_key}', True, [
+            *_SCORED_QUOTES,
+            ('strengths', 'strengths', 'list'),
+            ('improvement_points', 'improvement_points', 'list'),
+        ]) for aspect_key, aspect_name in [
+            ('factual_content_blue', 'factual_content'),
+            ('self_revelation_green', 'self_revelation'),
+            ('relational_aspect_yellow', 'relational_aspect'),
+            ('appeal_aspect_red', 'appeal_aspect'),
+        ]],
+        # Congruence and disruptions (replaces balance)
+        ('schulz.congruence', 'congruence_and_disruptions', False, [
+            ('congruence_judgment', 'congruence_judgment', 'text'),
+            ('dominant_side', 'dominant_side', 'text'),
+            ('disruptions', 'disruptions', 'text'),
+            ('healing_disruption', 'healing_disruption', 'text'),
+        ]),
+        ('schulz.overall', 'overall_picture', False, [
+            ('overall_communication_score', 'overall_communication_score', 'raw'),
+            *_TOP_3,
+        ]),
+    ],
+    'esthetiek': [
+        ('aesthetics.poetics', 'domain_a_poetics_of_language', False, [
+            ('average_score', 'average_score_language', 'raw'),
+        ]),
+        ('aesthetics.dramaturgy', 'domain_b_dramaturgy_of_structure', False, [
+            ('average_score', 'average_score_structure', 'raw'),
+        ]),
+        ('aesthetics.kitsch', 'kitsch_diagnosis', False, [
+            ('anti_kitsch_score', 'anti_kitsch_score', 'raw'),
+            ('analysis', 'analysis', 'text'),
+            ('quotes', 'quotes', 'list'),
+        ]),
+        ('aesthetics.space_for_grace', 'space_for_grace_analysis', False, [
+            ('space_score', 'space_score', 'raw'),
+            ('analysis', 'analysis', 'text'),
+            ('quotes', 'quotes', 'list'),
+        ]),
+        ('aesthetics.overall', 'overall_aesthetics', False, [
+            ('overall_aesthetic_score', 'overall_aesthetic_score', 'raw'),
+            *_TOP_3,
+        ]),
+    ],
+    'transactional': [
+        ('transactional.parent.freedom_CP', 'ego_positions_scan.parent.freedom_from_critical_parent_CP', True, _SCORED_QUOTES),
+        ('transactional.parent.nurturing_NP', 'ego_positions_scan.parent.healthy_care_NP', True, _SCORED_QUOTES),
+        ('transactional.adult', 'ego_positions_scan.adult', False, _SCORED_QUOTES),
+        ('transactional.child.freedom_AC', 'ego_positions_scan.child.freedom_from_adapted_child_AC', True, _SCORED_QUOTES),
+        ('transactional.child.free_FC', 'ego_positions_scan.child.free_child_FC', True, _SCORED_QUOTES),
+        ('transactional.transaction', 'transaction_analysis', False, [
+            ('communicative_purity_score', 'communicative_purity_score', 'raw'),
+            ('analysis', 'analysis', 'text'),
+            ('primary_transaction_style', 'primary_transaction_style', 'text'),
+            ('ulterior_motives', 'ulterior_motives', 'text'),
+        ]),
+        # Games and drama triangle have no score fields
+        ('transactional.games', 'games_analysis', False, [
+            ('detected_games', 'detected_games', 'list'),
+            ('absence_of_games_analysis', 'absence_of_games_analysis', 'text'),
+        ]),
+        ('transactional.drama', 'drama_triangle_analysis.preacher_roles', True, [
+            ('preacher_rescuer', 'rescuer', 'text'),
+            ('preacher_persecutor', 'persecutor', 'text'),
+            ('preacher_victim', 'victim', 'text'),
+        ]),
+        ('transactional.drama', 'drama_triangle_analysis', False, [
+            ('congregation_position', 'congregation_position', 'text'),
+            ('escape_possibilities', 'escape_possibilities', 'text'),
+        ]),
+        ('transactional.overall', 'conclusion_and_recommendation', False, [
+            ('psychological_health_score', 'psychological_health_score', 'raw'),
+            *_TOP_3,
+        ]),
+    ],
+    'metaphor': [
+        ('metaphor', 'primaire_analyse', False, [
+            ('dominante_domeinen', 'dominante_domeinen', 'list'),
+            ('metafoor_inventaris', 'metafoor_inventaris', 'list'),
+        ]),
+        ('metaphor.coherentie', 'diagnostische_evaluatie.coherentie_analyse', False, [
+            ('overall', 'overall_coherentie', 'text'),
+            ('verklaring', 'coherentie_verklaring', 'text'),
+            ('incoherentie_punten', 'incoherentie_punten', 'list'),
+            ('succesvolle_blending', 'succesvolle_blending', 'list'),
+        ]),
+        ('metaphor', 'diagnostische_evaluatie', False, [
+            ('sterktes', 'sterktes', 'list'),
+            ('risicos', 'risicos', 'list'),
+        ]),
+        ('metaphor.text_world', 'diagnostische_evaluatie.text_world_analyse', False, [
+            ('primaire_wereld', 'primaire_wereld', 'text'),
+            ('sub_worlds', 'sub_worlds', 'list'),
+            ('effectiviteit', 'world_building_effectiviteit', 'text'),
+            ('deictic_shifts', 'deictic_shifts', 'list'),
+        ]),
+        ('metaphor.schema', 'diagnostische_evaluatie.schema_analyse', False, [
+            ('versterkte_schemas', 'versterkte_schemas', 'list'),
+            ('verstoorde_schemas', 'verstoorde_schemas', 'list'),
+            ('liturgische_aansluiting', 'liturgische_schema_aansluiting', 'text'),
+        ]),
+        ('metaphor', 'aanbevelingen', False, [
+            ('audit_samenvatting', 'metafoor_audit_samenvatting', 'text'),
+            ('revitalisatie_suggesties', 'revitalisatie_suggesties', 'list'),
+            ('coherentie_verbeteringen', 'coherentie_verbeteringen', 'list'),
+            ('entailment_checks', 'entailment_checks', 'list'),
+            ('alternatieve_domeinen', 'alternatieve_domeinen', 'list'),
+            ('overall.beoordeling', 'overall_beoordeling', 'text'),
+            ('overall.slotopmerking', 'slotopmerking', 'text'),
+        ]),
+        ('metaphor.vergelijk', 'comparatieve_analyse', False, [
+            ('esthetiek', 'verschil_met_esthetiek', 'text'),
+            ('kolb', 'verschil_met_kolb', 'text'),
+            ('unieke_inzichten', 'unieke_inzichten_CMT', 'text'),
+        ]),
+        ('metaphor', 'appendices', False, [
+            ('volledige_metafoor_lijst', 'volledige_metafoor_lijst', 'list'),
+            ('woord_frequentie', 'woord_frequentie_analyse', 'dict'),
+            ('notities', 'notities', 'text'),
+        ]),
+    ],
+    'speech_act': [
+        ('speech_act.locutie', 'drievoudige_structuur_analyse.locutie', False, [
+            ('beschrijving', 'beschrijving', 'text'),
+            ('exegetische_kwaliteit', 'exegetische_kwaliteit', 'text'),
+            ('omvang_procent', 'omvang_procent', 'raw'),
+        ]),
+        ('speech_act.illocutie', 'drievoudige_structuur_analyse.illocutie', False, [
+            ('beschrijving', 'beschrijving', 'text'),
+            ('primaire_kracht', 'primaire_kracht', 'text'),
+            ('helderheid_score', 'helderheid_score', 'raw'),
+            ('voorbeelden', 'voorbeelden', 'list'),
+        ]),
+        ('speech_act.perlocutie', 'drievoudige_structuur_analyse.perlocutie', False, [
+            ('beoogd_effect', 'beoogd_effect', 'text'),
+            ('pneumatologisch_bewustzijn', 'pneumatologisch_bewustzijn', 'text'),
+            ('werkwoorden', 'perlocutionaire_werkwoorden', 'list'),
+        ]),
+        *[(f'speech_act.werkwoord.{category}', f'werkwoord_analyse.{category}', False, [
+            ('frequentie', 'frequentie', 'raw'),
+            ('procent', 'procent', 'raw'),
+            ('voorbeelden', 'voorbeelden', 'list'),
+            ('dominante_werkwoorden', 'dominante_werkwoorden', 'list'),
+        ]) for category in ['assertieven', 'directieven', 'expressieven', 'commissieven', 'declaratieven']],
+        ('speech_act.const_perf', 'constatief_performatief_diagnose', False, [
+            ('classificatie', 'primaire_classificatie', 'text'),
+            ('constatief_percentage', 'constatief_percentage', 'raw'),
+            ('performatief_percentage', 'performatief_percentage', 'raw'),
+            ('surplus_aanwezig', 'constatief_surplus_analyse.aanwezig', 'text'),
+            ('surplus_ernst', 'constatief_surplus_analyse.ernst', 'text'),
+            ('deficit_aanwezig', 'performatief_deficit_analyse.aanwezig', 'text'),
+            ('deficit_ernst', 'performatief_deficit_analyse.ernst', 'text'),
+        ]),
+        ('speech_act.toezegging', 'constatief_performatief_diagnose.toezegging_check', False, [
+            ('aanwezig', 'toezegging_aanwezig', 'text'),
+            ('aantal', 'aantal_toezeggen', 'raw'),
+            ('kwaliteit', 'kwaliteit_toezeggen', 'text'),
+        ]),
+        ('speech_act.adressering', 'adressering_analyse', False, [
+            ('effectiviteit', 'adressering_effectiviteit', 'raw'),
+            ('eerste_persoon.frequentie', 'persoonsvorm_distributie.eerste_persoon.frequentie', 'raw'),
+            ('tweede_persoon.frequentie', 'persoonsvorm_distributie.tweede_persoon.frequentie', 'raw'),
+            ('derde_persoon.frequentie', 'persoonsvorm_distributie.derde_persoon.frequentie', 'raw'),
+        ]),
+        ('speech_act.sacramenteel', 'sacramenteel_patroon_analyse', False, [
+            ('patroon', 'patroon_identificatie', 'text'),
+            ('foutief_aanwezig', 'foutief_patroon.aanwezig', 'text'),
+            ('sacramenteel_aanwezig', 'sacramenteel_patroon.aanwezig', 'text'),
+            ('sacramenteel_kwaliteit', 'sacramenteel_patroon.kwaliteit', 'text'),
+        ]),
+        ('speech_act.diagnose', 'diagnostische_evaluatie', False, [
+            ('primaire', 'primaire_diagnose', 'text'),
+            ('toelichting', 'diagnose_toelichting', 'text'),
+            ('sterke_punten', 'sterke_punten', 'list'),
+            ('zwakke_punten', 'zwakke_punten', 'list'),
+            ('gebeuren_score', 'gebeuren_score', 'raw'),
+            ('sacramentele_kracht', 'sacramentele_kracht', 'raw'),
+        ]),
+        ('speech_act.theologie', 'theologische_diepte_analyse', False, [
+            ('god_als_spreker', 'openbaringsleer.god_als_spreker', 'text'),
+            ('prediker_mandataris', 'openbaringsleer.prediker_als_mandataris', 'text'),
+            ('geest_rol', 'pneumatologie.geest_rol_erkend', 'text'),
+            ('preek_als_genademiddel', 'sacramentstheologie.preek_als_genademiddel', 'text'),
+        ]),
+        ('speech_act.aanbeveling', 'aanbevelingen', False, [
+            ('audit_samenvatting', 'werkwoord_audit_samenvatting', 'text'),
+            ('perf_intensivering_nodig', 'performatieve_intensivering.nodig', 'text'),
+            ('overall_beoordeling', 'overall_beoordeling', 'text'),
+            ('slotopmerking', 'slotopmerking', 'text'),
+        ]),
+    ],
+    'narrative': [
+        ('narrative.primair', 'actantiele_analyse.primair_narratief_programma', False, [
+            ('beschrijving', 'beschrijving', 'text'),
+        ]),
+        ('narrative.subject', 'actantiele_analyse.primair_narratief_programma.subject', False, [
+            ('identificatie', 'identificatie', 'text'),
+            ('frequentie_score', 'frequentie_score', 'raw'),
+        ]),
+        ('narrative.object', 'actantiele_analyse.primair_narratief_programma.object', False, [
+            ('identificatie', 'identificatie', 'text'),
+            ('aard', 'aard_van_object', 'text'),
+        ]),
+        ('narrative.zender', 'actantiele_analyse.primair_narratief_programma.zender', False, [
+            ('identificatie', 'identificatie', 'text'),
+            ('rol', 'rol_interpretatie', 'text'),
+        ]),
+        ('narrative.ontvanger', 'actantiele_analyse.primair_narratief_programma.ontvanger', False, [
+            ('identificatie', 'identificatie', 'text'),
+            ('positie_hoorder', 'positie_hoorder', 'text'),
+        ]),
+        ('narrative.helper', 'actantiele_analyse.primair_narratief_programma.helper', False, [
+            ('identificatie', 'identificatie', 'text'),
+            ('rol_god', 'rol_van_god', 'text'),
+            ('rol_geest', 'rol_van_geest', 'text'),
+        ]),
+        ('narrative.tegenstander', 'actantiele_analyse.primair_narratief_programma.tegenstander', False, [
+            ('identificatie', 'identificatie', 'text'),
+            ('ernst', 'ernst_tegenstander', 'text'),
+        ]),
+        ('narrative.secundair', 'actantiele_analyse.secundair_narratief_programma', False, [
+            ('aanwezig', 'aanwezig', 'text'),
+            ('beschrijving', 'beschrijving', 'text'),
+            ('verhouding', 'verhouding_tot_primair', 'text'),
+        ]),
+        # Raw counts (god_als_subject_count, mens_als_subject_count) are excluded
+        ('narrative.grammaticaal', 'grammaticale_analyse.subject_check', False, [
+            ('ratio', 'ratio', 'text'),
+            ('rutledge_score', 'rutledge_score', 'raw'),
+        ]),
+        ('narrative.modal', 'grammaticale_analyse.modale_analyse', False, [
+            ('dominante_modaliteit', 'dominante_modaliteit', 'text'),
+            ('interpretatie', 'modale_interpretatie', 'text'),
+        ]),
+        ('narrative.semiotisch', 'semiotisch_vierkant_analyse', False, [
+            ('s1', 'primaire_tegenstelling.s1', 'text'),
+            ('s2', 'primaire_tegenstelling.s2', 'text'),
+            ('beweging', 'beweging_in_preek', 'text'),
+            ('resolutie', 'theologische_resolutie', 'text'),
+        ]),
+        ('narrative.diagnose', 'diagnostische_evaluatie', False, [
+            ('classificatie', 'primaire_classificatie', 'text'),
+            ('toelichting', 'classificatie_toelichting', 'text'),
+            ('indicatoren_moralisme', 'indicatoren_moralisme', 'list'),
+            ('indicatoren_genade', 'indicatoren_genade', 'list'),
+        ]),
+        ('narrative.exemplarisme', 'diagnostische_evaluatie.exemplarisme_check', False, [
+            ('aanwezig', 'aanwezig', 'text'),
+            ('figuren', 'bijbelse_figuren_als_model', 'list'),
+        ]),
+        ('narrative.identificatie', 'diagnostische_evaluatie.identificatie_patroon', False, [
+            ('met', 'hoorder_identificeert_met', 'text'),
+            ('effect', 'effect_op_hoorder', 'text'),
+        ]),
+        ('narrative.coherentie', 'diagnostische_evaluatie.narratieve_coherentie', False, [
+            ('score', 'coherentie_score', 'raw'),
+        ]),
+        ('narrative.theologie', 'theologische_diepte_analyse', False, [
+            ('soteriologie_model', 'soteriologie.primaire_model', 'text'),
+            ('menselijke_rol', 'soteriologie.menselijke_rol_in_redding', 'text'),
+            ('geest_rol', 'pneumatologie.rol_heilige_geest', 'text'),
+            ('zonde_aard', 'hamartologie.aard_van_zonde', 'text'),
+            ('hoop_structuur', 'eschatologie.hoop_structuur', 'text'),
+        ]),
+        ('narrative.aanbeveling', 'aanbevelingen', False, [
+            ('audit_samenvatting', 'actantiele_audit_samenvatting', 'text'),
+            ('herpositionering_nodig', 'subject_herpositionering.nodig', 'text'),
+            ('overall_beoordeling', 'overall_beoordeling', 'text'),
+            ('slotopmerking', 'slotopmerking', 'text'),
+        ]),
+    ],
+}
+
+
+def _compile_schema(sections: list) -> list:
+    """
+    Pre-split dotted paths and pre-build column names for one analysis schema.
+    Single-key field paths stay plain strings so they can be looked up directly.
+    """
+    return [
+        (tuple(path.split('.')), required,
+         [(sys.intern(f"{prefix}.{suffix}"), key if '.' not in key else tuple(key.split('.')), kind)
+          for suffix, key, kind in fields])
+        for prefix, path, required, fields in sections
+    ]
+
+
+_COMPILED_SCHEMAS = {analysis_type: _compile_schema(sections)
+                     for analysis_type, sections in EXTRACTION_SCHEMAS.items()}
+
+# Sentinel for keys that are absent from the JSON
+_MISSING = object()
+
+# Shared default for absent sections in .get() chains; only ever read, never mutated
+_EMPTY: dict = {}
+
+# Interned column names for keys only known at runtime, built once per key
+_METADATA_COLUMNS: dict[str, str] = {}
+_CRITERION_COLUMNS: dict[tuple[str, str], tuple[str, ...]] = {}
+_DEKKER_FIELDS = ('score', 'findings', 'quotes', 'improvement_point')
+_ESTHETIEK_FIELDS = ('score', 'analysis', 'quotes')
+# Criterion key -> column name normalization, applied in order
+_DEKKER_NAME_REPLACEMENTS = (('criterion_', ''), ('concrete_concrete', 'concrete'))
+_ESTHETIEK_NAME_REPLACEMENTS = (('criterion_', ''),)
+_ESTHETIEK_DOMAINS = (('domain_a_poetics_of_language', 'aesthetics.poetics'),
+                      ('domain_b_dramaturgy_of_structure', 'aesthetics.dramaturgy'))
+
+
+def _walk(data: Any, path: tuple[str, ...]) -> Any:
+    """Follow a key path through nested dicts; returns _MISSING if any step is absent."""
+    for key in path:
+        if not isinstance(data, dict):
+            return _MISSING
+        data = data.get(key, _MISSING)
+    return data
+
+
+def _criterion_columns(prefix: str, criterion_key: str, fields: tuple[str, ...],
+                       replacements: tuple[tuple[str, str], ...]) -> tuple[str, ...]:
+    """
+    Return the interned '<prefix>.<name>.<field>' column names for one criterion,
+    where name is criterion_key with the replacements applied.
+    """
+    columns = _CRITERION_COLUMNS.get((prefix, criterion_key))
+    if columns is None:
+        name = criterion_key
+        for old, new in replacements:
+            name = name.replace(old, new)
+        columns = tuple(sys.intern(f'{prefix}.{name}.{field}') for field in fields)
+        _CRITERION_COLUMNS[(prefix, criterion_key)] = columns
+    return columns
+
+
+def _extract_dekker(data: dict, result: dict) -> None:
+    """Per-criterion dekker fields plus the average computed from them."""
+    # Analysis per criterion
+    criteria = data.get('analysis_per_criterion', _EMPTY)
+    criterion_scores = []
+    for criterion_key, criterion_data in criteria.items():
+        if isinstance(criterion_data, dict):
+            score_col, findings_col, quotes_col, improvement_col = _criterion_columns(
+                'dekker', criterion_key, _DEKKER_FIELDS, _DEKKER_NAME_REPLACEMENTS)
+            score = criterion_data.get('score_1_to_10', '')
+            result[score_col] = score
+            result[findings_col] = serialize_value(criterion_data.get('findings', ''))
+            result[quotes_col] = serialize_value(criterion_data.get('quotes', []))
+            result[improvement_col] = serialize_value(criterion_data.get('improvement_point', ''))
+            # Collect scores for average calculation
+            if score != '' and score is not None:
+                try:
+                    criterion_scores.append(float(score))
+                except (ValueError, TypeError):
+                    pass
+
+    # Compute average from sub-scores if not provided in JSON
+    overall = data.get('overall_dekker_analysis', _EMPTY)
+    avg_score = overall.get('average_score', '')
+    if (avg_score == '' or avg_score is None) and criterion_scores:
+        avg_score = sum(criterion_scores) / len(criterion_scores)
+    result['dekker.overall.average_score'] = avg_score
+
+
+def _extract_esthetiek(data: dict, result: dict) -> None:
+    """Per-criterion fields of the two aesthetics domains."""
+    for domain_key, prefix in _ESTHETIEK_DOMAINS:
+        domain = data.get(domain_key, _EMPTY)
+        for key, value in domain.items():
+            if key.startswith('criterion_'):
+                if isinstance(value, dict):
+                    score_col, analysis_col, quotes_col = _criterion_columns(
+                        prefix, key, _ESTHETIEK_FIELDS, _ESTHETIEK_NAME_REPLACEMENTS)
+                    result[score_col] = value.get('score', '')
+                    result[analysis_col] = serialize_value(value.get('analysis', ''))
+                    result[quotes_col] = serialize_value(value.get('quotes', []))
+
 
-    return dict(items)
+# Categorical metaphor coherence -> numeric score
+_COHERENTIE_SCORES = {
+    'HIGHLY_COHERENT': 10,
+    'MOSTLY_COHERENT': 7,
+    'MIXED': 4,
+    'INCOHERENT': 1
+}
+
+
+def _extract_metaphor(data: dict, result: dict) -> None:
+    """Numeric score derived from the categorical metaphor coherence."""
+    diag = data.get('diagnostische_evaluatie', _EMPTY)
+    coherentie = diag.get('coherentie_analyse', _EMPTY)
+    overall_coherentie = coherentie.get('overall_coherentie', '')
+    result['metaphor.coherentie.score'] = _COHERENTIE_SCORES.get(overall_coherentie, '')
+
+
+# Extraction steps that do not fit the declarative schemas
+_EXTRA_EXTRACTORS: dict[str, Callable[[dict, dict], None]] = {
+    'dekker': _extract_dekker,
+    'esthetiek': _extract_esthetiek,
+    'metaphor': _extract_metaphor,
+}
 
 
 def extract_analysis_data(data: dict, analysis_type: str) -> dict:
@@ -133,523 +743,110 @@ def extract_analysis_data(data: dict, analysis_type: str) -> dict:
     # Add metadata
     if 'metadata' in data:
         for key, value in data['metadata'].items():
-            result[f'metadata.{key}'] = serialize_value(value)
+            column = _METADATA_COLUMNS.get(key)
+            if column is None:
+                column = _METADATA_COLUMNS[key] = sys.intern(f'metadata.{key}')
+            # Metadata is nearly all plain strings; only other types need the dispatch
+            if type(value) is str:
+                result[column] = value if '\n' not in value and '\r' not in value else value.translate(_NEWLINE_TABLE)
+            else:
+                result[column] = serialize_value(value)
 
     # Extract analysis-specific data
-    if analysis_type == 'aristoteles':
-        # Aristotelian modes
-        modes = data.get('aristotelian_modes_analysis', {})
-        for mode in ['logos', 'pathos', 'ethos']:
-            if mode in modes:
-                mode_data = modes[mode]
-                result[f'aristoteles.{mode}.score'] = mode_data.get('score', '')
-                result[f'aristoteles.{mode}.analysis'] = serialize_value(mode_data.get('analysis', ''))
-                result[f'aristoteles.{mode}.quotes'] = serialize_value(mode_data.get('quotes', []))
-                result[f'aristoteles.{mode}.strengths'] = serialize_value(mode_data.get('strengths', []))
-                result[f'aristoteles.{mode}.improvement_points'] = serialize_value(mode_data.get('improvement_points', []))
-                result[f'aristoteles.{mode}.specific_diagnosis'] = serialize_value(mode_data.get('specific_diagnosis', ''))
-                if mode == 'pathos':
-                    result[f'aristoteles.{mode}.emotional_tone'] = serialize_value(mode_data.get('emotional_tone', ''))
-                if mode == 'ethos':
-                    result[f'aristoteles.{mode}.authenticity'] = serialize_value(mode_data.get('authenticity', ''))
-
-        # Balance analysis
-        balance = data.get('rhetorical_balance_analysis', {})
-        result['aristoteles.balance.dominant_mode'] = serialize_value(balance.get('dominant_mode', ''))
-        result['aristoteles.balance.suppressed_mode'] = serialize_value(balance.get('suppressed_mode', ''))
-        result['aristoteles.balance.balance_score'] = balance.get('balance_score', '')
-        result['aristoteles.balance.analysis'] = serialize_value(balance.get('analysis', ''))
-        result['aristoteles.balance.consequences_of_imbalance'] = serialize_value(balance.get('consequences_of_imbalance', []))
-        result['aristoteles.balance.recommendation_for_balance'] = serialize_value(balance.get('recommendation_for_balance', ''))
-
-        # Orthodoxy/Orthopathy/Orthopraxy
-        ortho = data.get('orthodoxy_orthopathy_orthopraxy', {})
-        for key in ['orthodoxy_logos', 'orthopathy_pathos', 'orthopraxy_ethos']:
-            if key in ortho:
-                result[f'aristoteles.{key}.score'] = ortho[key].get('score', '')
-                result[f'aristoteles.{key}.analysis'] = serialize_value(ortho[key].get('analysis', ''))
-
-        # Overall picture
-        overall = data.get('overall_picture', {})
-        result['aristoteles.overall.overall_rhetorical_score'] = overall.get('overall_rhetorical_score', '')
-        result['aristoteles.overall.summary'] = serialize_value(overall.get('summary', ''))
-        result['aristoteles.overall.strengths_top_3'] = serialize_value(overall.get('strengths_top_3', []))
-        result['aristoteles.overall.improvement_points_top_3'] = serialize_value(overall.get('improvement_points_top_3', []))
-        result['aristoteles.overall.primary_rhetorical_style'] = serialize_value(overall.get('primary_rhetorical_style', ''))
-        result['aristoteles.overall.audience_analysis'] = serialize_value(overall.get('audience_analysis', ''))
-        result['aristoteles.overall.recommendations_for_next_sermon'] = serialize_value(overall.get('recommendations_for_next_sermon', []))
-        result['aristoteles.overall.conclusion'] = serialize_value(overall.get('conclusion', ''))
-
-    elif analysis_type == 'dekker':
-        # Analysis per criterion
-        criteria = data.get('analysis_per_criterion', {})
-        criterion_scores = []
-        for criterion_key, criterion_data in criteria.items():
-            if isinstance(criterion_data, dict):
-                # Normalize criterion name
-                normalized_key = criterion_key.replace('criterion_', '').replace('concrete_concrete', 'concrete')
-                score = criterion_data.get('score_1_to_10', '')
-                result[f'dekker.{normalized_key}.score'] = score
-                result[f'dekker.{normalized_key}.findings'] = serialize_value(criterion_data.get('findings', ''))
-                result[f'dekker.{normalized_key}.quotes'] = serialize_value(criterion_data.get('quotes', []))
-                result[f'dekker.{normalized_key}.improvement_point'] = serialize_value(criterion_data.get('improvement_point', ''))
-                # Collect scores for average calculation
-                if score != '' and score is not None:
-                    try:
-                        criterion_scores.append(float(score))
-                    except (ValueError, TypeError):
-                        pass
-
-        # Overall dekker analysis
-        overall = data.get('overall_dekker_analysis', {})
-        # Compute average from sub-scores if not provided in JSON
-        avg_score = overall.get('average_score', '')
-        if (avg_score == '' or avg_score is None) and criterion_scores:
-            avg_score = sum(criterion_scores) / len(criterion_scores)
-        result['dekker.overall.average_score'] = avg_score
-        result['dekker.overall.strengths'] = serialize_value(overall.get('strengths', []))
-        result['dekker.overall.weaknesses'] = serialize_value(overall.get('weaknesses', []))
-        result['dekker.overall.general_recommendation'] = serialize_value(overall.get('general_recommendation', ''))
-
-    elif analysis_type == 'kolb':
-        # Kolb phases
-        phases = data.get('kolb_phases_analysis', {})
-        phase_names = {
-            'phase_1_concrete_experience': 'concrete_experience',
-            'phase_2_reflective_observation': 'reflective_observation',
-            'phase_3_abstract_conceptualization': 'abstract_conceptualization',
-            'phase_4_active_experimentation': 'active_experimentation'
-        }
-
-        for phase_key, phase_name in phase_names.items():
-            if phase_key in phases:
-                phase_data = phases[phase_key]
-                result[f'kolb.{phase_name}.score'] = phase_data.get('score', '')
-                result[f'kolb.{phase_name}.analysis'] = serialize_value(phase_data.get('analysis', ''))
-                result[f'kolb.{phase_name}.quotes'] = serialize_value(phase_data.get('quotes', []))
-                result[f'kolb.{phase_name}.strengths'] = serialize_value(phase_data.get('strengths', []))
-                result[f'kolb.{phase_name}.improvement_points'] = serialize_value(phase_data.get('improvement_points', []))
-                result[f'kolb.{phase_name}.homiletical_manifestations'] = serialize_value(phase_data.get('homiletical_manifestations', ''))
-
-        # Learning styles
-        styles = data.get('learning_styles_analysis', {})
-        for style in ['dreamer', 'thinker', 'doer', 'decider']:
-            if style in styles:
-                style_data = styles[style]
-                result[f'kolb.learning_style.{style}.score'] = style_data.get('score', '')
-                result[f'kolb.learning_style.{style}.analysis'] = serialize_value(style_data.get('analysis', ''))
-
-        # Integrality
-        integ = data.get('integrality_and_cycle', {})
-        for key in ['cycle_completeness', 'balance_between_phases', 'holistic_learning']:
-            if key in integ:
-                integ_data = integ[key]
-                result[f'kolb.integrality.{key}.score'] = integ_data.get('score', '')
-                result[f'kolb.integrality.{key}.analysis'] = serialize_value(integ_data.get('analysis', ''))
-
-        # Overall
-        overall = data.get('overall_picture', {})
-        result['kolb.overall.overall_kolb_score'] = overall.get('overall_kolb_score', '')
-        result['kolb.overall.summary'] = serialize_value(overall.get('summary', ''))
-        result['kolb.overall.strengths_top_3'] = serialize_value(overall.get('strengths_top_3', []))
-        result['kolb.overall.improvement_points_top_3'] = serialize_value(overall.get('improvement_points_top_3', []))
-
-    elif analysis_type == 'schulz_von_thun':
-        # Four aspects
-        aspects = data.get('schulz_von_thun_analysis', {})
-        aspect_names = {
-            'factual_content_blue': 'factual_content',
-            'self_revelation_green': 'self_revelation',
-            'relational_aspect_yellow': 'relational_aspect',
-            'appeal_aspect_red': 'appeal_aspect'
-        }
-
-        for aspect_key, aspect_name in aspect_names.items():
-            if aspect_key in aspects:
-                aspect_data = aspects[aspect_key]
-                result[f'schulz.{aspect_name}.score'] = aspect_data.get('score', '')
-                result[f'schulz.{aspect_name}.analysis'] = serialize_value(aspect_data.get('analysis', ''))
-                result[f'schulz.{aspect_name}.quotes'] = serialize_value(aspect_data.get('quotes', []))
-                result[f'schulz.{aspect_name}.strengths'] = serialize_value(aspect_data.get('strengths', []))
-                result[f'schulz.{aspect_name}.improvement_points'] = serialize_value(aspect_data.get('improvement_points', []))
-
-        # Congruence and disruptions (replaces balance)
-        congruence = data.get('congruence_and_disruptions', {})
-        result['schulz.congruence.congruence_judgment'] = serialize_value(congruence.get('congruence_judgment', ''))
-        result['schulz.congruence.dominant_side'] = serialize_value(congruence.get('dominant_side', ''))
-        result['schulz.congruence.disruptions'] = serialize_value(congruence.get('disruptions', ''))
-        result['schulz.congruence.healing_disruption'] = serialize_value(congruence.get('healing_disruption', ''))
-
-        # Overall
-        overall = data.get('overall_picture', {})
-        result['schulz.overall.overall_communication_score'] = overall.get('overall_communication_score', '')
-        result['schulz.overall.summary'] = serialize_value(overall.get('summary', ''))
-        result['schulz.overall.strengths_top_3'] = serialize_value(overall.get('strengths_top_3', []))
-        result['schulz.overall.improvement_points_top_3'] = serialize_value(overall.get('improvement_points_top_3', []))
-
-    elif analysis_type == 'esthetiek':
-        # Domain A - Poetics of Language
-        dom_a = data.get('domain_a_poetics_of_language', {})
-        result['aesthetics.poetics.average_score'] = dom_a.get('average_score_language', '')
-        for key, value in dom_a.items():
-            if key.startswith('criterion_'):
-                if isinstance(value, dict):
-                    criterion_name = key.replace('criterion_', '')
-                    result[f'aesthetics.poetics.{criterion_name}.score'] = value.get('score', '')
-                    result[f'aesthetics.poetics.{criterion_name}.analysis'] = serialize_value(value.get('analysis', ''))
-                    result[f'aesthetics.poetics.{criterion_name}.quotes'] = serialize_value(value.get('quotes', []))
-
-        # Domain B - Dramaturgy of Structure
-        dom_b = data.get('domain_b_dramaturgy_of_structure', {})
-        result['aesthetics.dramaturgy.average_score'] = dom_b.get('average_score_structure', '')
-        for key, value in dom_b.items():
-            if key.startswith('criterion_'):
-                if isinstance(value, dict):
-                    criterion_name = key.replace('criterion_', '')
-                    result[f'aesthetics.dramaturgy.{criterion_name}.score'] = value.get('score', '')
-                    result[f'aesthetics.dramaturgy.{criterion_name}.analysis'] = serialize_value(value.get('analysis', ''))
-                    result[f'aesthetics.dramaturgy.{criterion_name}.quotes'] = serialize_value(value.get('quotes', []))
-
-        # Kitsch diagnosis
-        kitsch = data.get('kitsch_diagnosis', {})
-        result['aesthetics.kitsch.anti_kitsch_score'] = kitsch.get('anti_kitsch_score', '')
-        result['aesthetics.kitsch.analysis'] = serialize_value(kitsch.get('analysis', ''))
-        result['aesthetics.kitsch.quotes'] = serialize_value(kitsch.get('quotes', []))
-
-        # Space for grace
-        space = data.get('space_for_grace_analysis', {})
-        result['aesthetics.space_for_grace.space_score'] = space.get('space_score', '')
-        result['aesthetics.space_for_grace.analysis'] = serialize_value(space.get('analysis', ''))
-        result['aesthetics.space_for_grace.quotes'] = serialize_value(space.get('quotes', []))
-
-        # Overall
-        overall = data.get('overall_aesthetics', {})
-        result['aesthetics.overall.overall_aesthetic_score'] = overall.get('overall_aesthetic_score', '')
-        result['aesthetics.overall.summary'] = serialize_value(overall.get('summary', ''))
-        result['aesthetics.overall.strengths_top_3'] = serialize_value(overall.get('strengths_top_3', []))
-        result['aesthetics.overall.improvement_points_top_3'] = serialize_value(overall.get('improvement_points_top_3', []))
-
-    elif analysis_type == 'transactional':
-        # Ego positions scan
-        ego = data.get('ego_positions_scan', {})
-
-        # Parent
-        parent = ego.get('parent', {})
-        for key in ['freedom_from_critical_parent_CP', 'healthy_care_NP']:
-            if key in parent:
-                key_clean = key.replace('freedom_from_critical_parent_CP', 'freedom_CP').replace('healthy_care_NP', 'nurturing_NP')
-                parent_data = parent[key]
-                result[f'transactional.parent.{key_clean}.score'] = parent_data.get('score', '')
-                result[f'transactional.parent.{key_clean}.analysis'] = serialize_value(parent_data.get('analysis', ''))
-                result[f'transactional.parent.{key_clean}.quotes'] = serialize_value(parent_data.get('quotes', []))
-
-        # Adult
-        adult = ego.get('adult', {})
-        result['transactional.adult.score'] = adult.get('score', '')
-        result['transactional.adult.analysis'] = serialize_value(adult.get('analysis', ''))
-        result['transactional.adult.quotes'] = serialize_value(adult.get('quotes', []))
-
-        # Child
-        child = ego.get('child', {})
-        for key in ['freedom_from_adapted_child_AC', 'free_child_FC']:
-            if key in child:
-                key_clean = key.replace('freedom_from_adapted_child_AC', 'freedom_AC').replace('free_child_FC', 'free_FC')
-                child_data = child[key]
-                result[f'transactional.child.{key_clean}.score'] = child_data.get('score', '')
-                result[f'transactional.child.{key_clean}.analysis'] = serialize_value(child_data.get('analysis', ''))
-                result[f'transactional.child.{key_clean}.quotes'] = serialize_value(child_data.get('quotes', []))
-
-        # Transaction analysis
-        trans = data.get('transaction_analysis', {})
-        result['transactional.transaction.communicative_purity_score'] = trans.get('communicative_purity_score', '')
-        result['transactional.transaction.analysis'] = serialize_value(trans.get('analysis', ''))
-        result['transactional.transaction.primary_transaction_style'] = serialize_value(trans.get('primary_transaction_style', ''))
-        result['transactional.transaction.ulterior_motives'] = serialize_value(trans.get('ulterior_motives', ''))
-
-        # Games analysis (no score field, just detected_games)
-        games = data.get('games_analysis', {})
-        result['transactional.games.detected_games'] = serialize_value(games.get('detected_games', []))
-        result['transactional.games.absence_of_games_analysis'] = serialize_value(games.get('absence_of_games_analysis', ''))
-
-        # Drama triangle analysis (no score field)
-        drama = data.get('drama_triangle_analysis', {})
-        if isinstance(drama.get('preacher_roles'), dict):
-            result['transactional.drama.preacher_rescuer'] = serialize_value(drama['preacher_roles'].get('rescuer', ''))
-            result['transactional.drama.preacher_persecutor'] = serialize_value(drama['preacher_roles'].get('persecutor', ''))
-            result['transactional.drama.preacher_victim'] = serialize_value(drama['preacher_roles'].get('victim', ''))
-        result['transactional.drama.congregation_position'] = serialize_value(drama.get('congregation_position', ''))
-        result['transactional.drama.escape_possibilities'] = serialize_value(drama.get('escape_possibilities', ''))
-
-        # Overall
-        conclusion = data.get('conclusion_and_recommendation', {})
-        result['transactional.overall.psychological_health_score'] = conclusion.get('psychological_health_score', '')
-        result['transactional.overall.summary'] = serialize_value(conclusion.get('summary', ''))
-        result['transactional.overall.strengths_top_3'] = serialize_value(conclusion.get('strengths_top_3', []))
-        result['transactional.overall.improvement_points_top_3'] = serialize_value(conclusion.get('improvement_points_top_3', []))
-
-    elif analysis_type == 'metaphor':
-        # Primary analysis - dominant domains
-        primaire = data.get('primaire_analyse', {})
-        result['metaphor.dominante_domeinen'] = serialize_value(primaire.get('dominante_domeinen', []))
-        result['metaphor.metafoor_inventaris'] = serialize_value(primaire.get('metafoor_inventaris', []))
-
-        # Diagnostic evaluation
-        diag = data.get('diagnostische_evaluatie', {})
-        coherentie = diag.get('coherentie_analyse', {})
-        result['metaphor.coherentie.overall'] = serialize_value(coherentie.get('overall_coherentie', ''))
-        # Convert categorical coherence to numeric score
-        coherentie_mapping = {
-            'HIGHLY_COHERENT': 10,
-            'MOSTLY_COHERENT': 7,
-            'MIXED': 4,
-            'INCOHERENT': 1
-        }
-        overall_coherentie = coherentie.get('overall_coherentie', '')
-        result['metaphor.coherentie.score'] = coherentie_mapping.get(overall_coherentie, '')
-        result['metaphor.coherentie.verklaring'] = serialize_value(coherentie.get('coherentie_verklaring', ''))
-        result['metaphor.coherentie.incoherentie_punten'] = serialize_value(coherentie.get('incoherentie_punten', []))
-        result['metaphor.coherentie.succesvolle_blending'] = serialize_value(coherentie.get('succesvolle_blending', []))
-        result['metaphor.sterktes'] = serialize_value(diag.get('sterktes', []))
-        result['metaphor.risicos'] = serialize_value(diag.get('risicos', []))
-
-        # Text world analysis
-        text_world = diag.get('text_world_analyse', {})
-        result['metaphor.text_world.primaire_wereld'] = serialize_value(text_world.get('primaire_wereld', ''))
-        result['metaphor.text_world.sub_worlds'] = serialize_value(text_world.get('sub_worlds', []))
-        result['metaphor.text_world.effectiviteit'] = serialize_value(text_world.get('world_building_effectiviteit', ''))
-        result['metaphor.text_world.deictic_shifts'] = serialize_value(text_world.get('deictic_shifts', []))
-
-        # Schema analysis
-        schema = diag.get('schema_analyse', {})
-        result['metaphor.schema.versterkte_schemas'] = serialize_value(schema.get('versterkte_schemas', []))
-        result['metaphor.schema.verstoorde_schemas'] = serialize_value(schema.get('verstoorde_schemas', []))
-        result['metaphor.schema.liturgische_aansluiting'] = serialize_value(schema.get('liturgische_schema_aansluiting', ''))
-
-        # Recommendations
-        aanbev = data.get('aanbevelingen', {})
-        result['metaphor.audit_samenvatting'] = serialize_value(aanbev.get('metafoor_audit_samenvatting', ''))
-        result['metaphor.revitalisatie_suggesties'] = serialize_value(aanbev.get('revitalisatie_suggesties', []))
-        result['metaphor.coherentie_verbeteringen'] = serialize_value(aanbev.get('coherentie_verbeteringen', []))
-        result['metaphor.entailment_checks'] = serialize_value(aanbev.get('entailment_checks', []))
-        result['metaphor.alternatieve_domeinen'] = serialize_value(aanbev.get('alternatieve_domeinen', []))
-        result['metaphor.overall.beoordeling'] = serialize_value(aanbev.get('overall_beoordeling', ''))
-        result['metaphor.overall.slotopmerking'] = serialize_value(aanbev.get('slotopmerking', ''))
-
-        # Comparative analysis
-        comp = data.get('comparatieve_analyse', {})
-        result['metaphor.vergelijk.esthetiek'] = serialize_value(comp.get('verschil_met_esthetiek', ''))
-        result['metaphor.vergelijk.kolb'] = serialize_value(comp.get('verschil_met_kolb', ''))
-        result['metaphor.vergelijk.unieke_inzichten'] = serialize_value(comp.get('unieke_inzichten_CMT', ''))
-
-        # Appendices
-        appendices = data.get('appendices', {})
-        result['metaphor.volledige_metafoor_lijst'] = serialize_value(appendices.get('volledige_metafoor_lijst', []))
-        result['metaphor.woord_frequentie'] = serialize_value(appendices.get('woord_frequentie_analyse', {}))
-        result['metaphor.notities'] = serialize_value(appendices.get('notities', ''))
-
-    elif analysis_type == 'speech_act':
-        # Threefold structure analysis
-        drievoudig = data.get('drievoudige_structuur_analyse', {})
-        locutie = drievoudig.get('locutie', {})
-        result['speech_act.locutie.beschrijving'] = serialize_value(locutie.get('beschrijving', ''))
-        result['speech_act.locutie.exegetische_kwaliteit'] = serialize_value(locutie.get('exegetische_kwaliteit', ''))
-        result['speech_act.locutie.omvang_procent'] = locutie.get('omvang_procent', '')
-
-        illocutie = drievoudig.get('illocutie', {})
-        result['speech_act.illocutie.beschrijving'] = serialize_value(illocutie.get('beschrijving', ''))
-        result['speech_act.illocutie.primaire_kracht'] = serialize_value(illocutie.get('primaire_kracht', ''))
-        result['speech_act.illocutie.helderheid_score'] = illocutie.get('helderheid_score', '')
-        result['speech_act.illocutie.voorbeelden'] = serialize_value(illocutie.get('voorbeelden', []))
-
-        perlocutie = drievoudig.get('perlocutie', {})
-        result['speech_act.perlocutie.beoogd_effect'] = serialize_value(perlocutie.get('beoogd_effect', ''))
-        result['speech_act.perlocutie.pneumatologisch_bewustzijn'] = serialize_value(perlocutie.get('pneumatologisch_bewustzijn', ''))
-        result['speech_act.perlocutie.werkwoorden'] = serialize_value(perlocutie.get('perlocutionaire_werkwoorden', []))
-
-        # Verb analysis
-        werkwoord = data.get('werkwoord_analyse', {})
-        for category in ['assertieven', 'directieven', 'expressieven', 'commissieven', 'declaratieven']:
-            cat_data = werkwoord.get(category, {})
-            result[f'speech_act.werkwoord.{category}.frequentie'] = cat_data.get('frequentie', '')
-            result[f'speech_act.werkwoord.{category}.procent'] = cat_data.get('procent', '')
-            result[f'speech_act.werkwoord.{category}.voorbeelden'] = serialize_value(cat_data.get('voorbeelden', []))
-            result[f'speech_act.werkwoord.{category}.dominante_werkwoorden'] = serialize_value(cat_data.get('dominante_werkwoorden', []))
-
-        # Constative/Performative diagnosis
-        const_perf = data.get('constatief_performatief_diagnose', {})
-        result['speech_act.const_perf.classificatie'] = serialize_value(const_perf.get('primaire_classificatie', ''))
-        result['speech_act.const_perf.constatief_percentage'] = const_perf.get('constatief_percentage', '')
-        result['speech_act.const_perf.performatief_percentage'] = const_perf.get('performatief_percentage', '')
-
-        surplus = const_perf.get('constatief_surplus_analyse', {})
-        result['speech_act.const_perf.surplus_aanwezig'] = serialize_value(surplus.get('aanwezig', ''))
-        result['speech_act.const_perf.surplus_ernst'] = serialize_value(surplus.get('ernst', ''))
-
-        deficit = const_perf.get('performatief_deficit_analyse', {})
-        result['speech_act.const_perf.deficit_aanwezig'] = serialize_value(deficit.get('aanwezig', ''))
-        result['speech_act.const_perf.deficit_ernst'] = serialize_value(deficit.get('ernst', ''))
-
-        toezegging = const_perf.get('toezegging_check', {})
-        result['speech_act.toezegging.aanwezig'] = serialize_value(toezegging.get('toezegging_aanwezig', ''))
-        result['speech_act.toezegging.aantal'] = toezegging.get('aantal_toezeggen', '')
-        result['speech_act.toezegging.kwaliteit'] = serialize_value(toezegging.get('kwaliteit_toezeggen', ''))
-
-        # Addressing analysis
-        adres = data.get('adressering_analyse', {})
-        result['speech_act.adressering.effectiviteit'] = adres.get('adressering_effectiviteit', '')
-        persoon = adres.get('persoonsvorm_distributie', {})
-        for p in ['eerste_persoon', 'tweede_persoon', 'derde_persoon']:
-            p_data = persoon.get(p, {})
-            result[f'speech_act.adressering.{p}.frequentie'] = p_data.get('frequentie', '')
-
-        # Sacramental pattern analysis
-        sacr = data.get('sacramenteel_patroon_analyse', {})
-        result['speech_act.sacramenteel.patroon'] = serialize_value(sacr.get('patroon_identificatie', ''))
-        fout = sacr.get('foutief_patroon', {})
-        result['speech_act.sacramenteel.foutief_aanwezig'] = serialize_value(fout.get('aanwezig', ''))
-        sacr_patr = sacr.get('sacramenteel_patroon', {})
-        result['speech_act.sacramenteel.sacramenteel_aanwezig'] = serialize_value(sacr_patr.get('aanwezig', ''))
-        result['speech_act.sacramenteel.sacramenteel_kwaliteit'] = serialize_value(sacr_patr.get('kwaliteit', ''))
-
-        # Diagnostic evaluation
-        diag = data.get('diagnostische_evaluatie', {})
-        result['speech_act.diagnose.primaire'] = serialize_value(diag.get('primaire_diagnose', ''))
-        result['speech_act.diagnose.toelichting'] = serialize_value(diag.get('diagnose_toelichting', ''))
-        result['speech_act.diagnose.sterke_punten'] = serialize_value(diag.get('sterke_punten', []))
-        result['speech_act.diagnose.zwakke_punten'] = serialize_value(diag.get('zwakke_punten', []))
-        result['speech_act.diagnose.gebeuren_score'] = diag.get('gebeuren_score', '')
-        result['speech_act.diagnose.sacramentele_kracht'] = diag.get('sacramentele_kracht', '')
-
-        # Theological depth analysis
-        theol = data.get('theologische_diepte_analyse', {})
-        openb = theol.get('openbaringsleer', {})
-        result['speech_act.theologie.god_als_spreker'] = serialize_value(openb.get('god_als_spreker', ''))
-        result['speech_act.theologie.prediker_mandataris'] = serialize_value(openb.get('prediker_als_mandataris', ''))
-        pneum = theol.get('pneumatologie', {})
-        result['speech_act.theologie.geest_rol'] = serialize_value(pneum.get('geest_rol_erkend', ''))
-        sacr_theol = theol.get('sacramentstheologie', {})
-        result['speech_act.theologie.preek_als_genademiddel'] = serialize_value(sacr_theol.get('preek_als_genademiddel', ''))
-
-        # Recommendations
-        aanbev = data.get('aanbevelingen', {})
-        result['speech_act.aanbeveling.audit_samenvatting'] = serialize_value(aanbev.get('werkwoord_audit_samenvatting', ''))
-        perf_int = aanbev.get('performatieve_intensivering', {})
-        result['speech_act.aanbeveling.perf_intensivering_nodig'] = serialize_value(perf_int.get('nodig', ''))
-        result['speech_act.aanbeveling.overall_beoordeling'] = serialize_value(aanbev.get('overall_beoordeling', ''))
-        result['speech_act.aanbeveling.slotopmerking'] = serialize_value(aanbev.get('slotopmerking', ''))
-
-    elif analysis_type == 'narrative':
-        # Actantial analysis
-        actant = data.get('actantiele_analyse', {})
-        primair = actant.get('primair_narratief_programma', {})
-        result['narrative.primair.beschrijving'] = serialize_value(primair.get('beschrijving', ''))
-
-        # Subject
-        subject = primair.get('subject', {})
-        result['narrative.subject.identificatie'] = serialize_value(subject.get('identificatie', ''))
-        result['narrative.subject.frequentie_score'] = subject.get('frequentie_score', '')
-
-        # Object
-        obj = primair.get('object', {})
-        result['narrative.object.identificatie'] = serialize_value(obj.get('identificatie', ''))
-        result['narrative.object.aard'] = serialize_value(obj.get('aard_van_object', ''))
-
-        # Sender
-        zender = primair.get('zender', {})
-        result['narrative.zender.identificatie'] = serialize_value(zender.get('identificatie', ''))
-        result['narrative.zender.rol'] = serialize_value(zender.get('rol_interpretatie', ''))
-
-        # Receiver
-        ontvanger = primair.get('ontvanger', {})
-        result['narrative.ontvanger.identificatie'] = serialize_value(ontvanger.get('identificatie', ''))
-        result['narrative.ontvanger.positie_hoorder'] = serialize_value(ontvanger.get('positie_hoorder', ''))
-
-        # Helper
-        helper = primair.get('helper', {})
-        result['narrative.helper.identificatie'] = serialize_value(helper.get('identificatie', ''))
-        result['narrative.helper.rol_god'] = serialize_value(helper.get('rol_van_god', ''))
-        result['narrative.helper.rol_geest'] = serialize_value(helper.get('rol_van_geest', ''))
-
-        # Opponent
-        tegenst = primair.get('tegenstander', {})
-        result['narrative.tegenstander.identificatie'] = serialize_value(tegenst.get('identificatie', ''))
-        result['narrative.tegenstander.ernst'] = serialize_value(tegenst.get('ernst_tegenstander', ''))
-
-        # Secondary narrative program
-        secundair = actant.get('secundair_narratief_programma', {})
-        result['narrative.secundair.aanwezig'] = serialize_value(secundair.get('aanwezig', ''))
-        result['narrative.secundair.beschrijving'] = serialize_value(secundair.get('beschrijving', ''))
-        result['narrative.secundair.verhouding'] = serialize_value(secundair.get('verhouding_tot_primair', ''))
-
-        # Grammatical analysis (excluding raw counts: god_als_subject_count, mens_als_subject_count)
-        gram = data.get('grammaticale_analyse', {})
-        subject_check = gram.get('subject_check', {})
-        result['narrative.grammaticaal.ratio'] = serialize_value(subject_check.get('ratio', ''))
-        result['narrative.grammaticaal.rutledge_score'] = subject_check.get('rutledge_score', '')
-
-        # Modal analysis
-        modal = gram.get('modale_analyse', {})
-        result['narrative.modal.dominante_modaliteit'] = serialize_value(modal.get('dominante_modaliteit', ''))
-        result['narrative.modal.interpretatie'] = serialize_value(modal.get('modale_interpretatie', ''))
-
-        # Semiotic square
-        semiot = data.get('semiotisch_vierkant_analyse', {})
-        prim_teg = semiot.get('primaire_tegenstelling', {})
-        result['narrative.semiotisch.s1'] = serialize_value(prim_teg.get('s1', ''))
-        result['narrative.semiotisch.s2'] = serialize_value(prim_teg.get('s2', ''))
-        result['narrative.semiotisch.beweging'] = serialize_value(semiot.get('beweging_in_preek', ''))
-        result['narrative.semiotisch.resolutie'] = serialize_value(semiot.get('theologische_resolutie', ''))
-
-        # Diagnostic evaluation
-        diag = data.get('diagnostische_evaluatie', {})
-        result['narrative.diagnose.classificatie'] = serialize_value(diag.get('primaire_classificatie', ''))
-        result['narrative.diagnose.toelichting'] = serialize_value(diag.get('classificatie_toelichting', ''))
-        result['narrative.diagnose.indicatoren_moralisme'] = serialize_value(diag.get('indicatoren_moralisme', []))
-        result['narrative.diagnose.indicatoren_genade'] = serialize_value(diag.get('indicatoren_genade', []))
-
-        exemplarisme = diag.get('exemplarisme_check', {})
-        result['narrative.exemplarisme.aanwezig'] = serialize_value(exemplarisme.get('aanwezig', ''))
-        result['narrative.exemplarisme.figuren'] = serialize_value(exemplarisme.get('bijbelse_figuren_als_model', []))
-
-        identificatie = diag.get('identificatie_patroon', {})
-        result['narrative.identificatie.met'] = serialize_value(identificatie.get('hoorder_identificeert_met', ''))
-        result['narrative.identificatie.effect'] = serialize_value(identificatie.get('effect_op_hoorder', ''))
-
-        coherentie = diag.get('narratieve_coherentie', {})
-        result['narrative.coherentie.score'] = coherentie.get('coherentie_score', '')
-
-        # Theological depth
-        theol = data.get('theologische_diepte_analyse', {})
-        soter = theol.get('soteriologie', {})
-        result['narrative.theologie.soteriologie_model'] = serialize_value(soter.get('primaire_model', ''))
-        result['narrative.theologie.menselijke_rol'] = serialize_value(soter.get('menselijke_rol_in_redding', ''))
-
-        pneum = theol.get('pneumatologie', {})
-        result['narrative.theologie.geest_rol'] = serialize_value(pneum.get('rol_heilige_geest', ''))
-
-        hamart = theol.get('hamartologie', {})
-        result['narrative.theologie.zonde_aard'] = serialize_value(hamart.get('aard_van_zonde', ''))
-
-        eschat = theol.get('eschatologie', {})
-        result['narrative.theologie.hoop_structuur'] = serialize_value(eschat.get('hoop_structuur', ''))
-
-        # Recommendations
-        aanbev = data.get('aanbevelingen', {})
-        result['narrative.aanbeveling.audit_samenvatting'] = serialize_value(aanbev.get('actantiele_audit_samenvatting', ''))
-        subj_herp = aanbev.get('subject_herpositionering', {})
-        result['narrative.aanbeveling.herpositionering_nodig'] = serialize_value(subj_herp.get('nodig', ''))
-        result['narrative.aanbeveling.overall_beoordeling'] = serialize_value(aanbev.get('overall_beoordeling', ''))
-        result['narrative.aanbeveling.slotopmerking'] = serialize_value(aanbev.get('slotopmerking', ''))
+    for path, required, fields in _COMPILED_SCHEMAS.get(analysis_type, ()):
+        section = _walk(data, path)
+        if not isinstance(section, dict):
+            if required:
+                continue
+            section = _EMPTY
+        for column, key_path, kind in fields:
+            if type(key_path) is str:
+                value = section.get(key_path, _MISSING)
+            else:
+                value = _walk(section, key_path)
+            if value is _MISSING:
+                result[column] = _KIND_DEFAULTS[kind]
+            elif kind == 'raw':
+                result[column] = value
+            elif not value and type(value) in _EMPTY_CELLS:
+                result[column] = _EMPTY_CELLS[type(value)]
+            else:
+                result[column] = serialize_value(value)
+
+    extra = _EXTRA_EXTRACTORS.get(analysis_type)
+    if extra is not None:
+        extra(data, result)
 
     return result
 
 
+def load_sermon_file(filepath: Path, analysis_type: str) -> tuple[dict | None, str | None]:
+    """
+    Parse and extract a single analysis file. Runs in a worker process.
+    The filename has already been parsed and accepted by the caller.
+
+    Returns:
+        (extracted, warning) where extracted is None if the file is skipped
+    """
+    try:
+        data = load_json(filepath)
+    except (json.JSONDecodeError, IOError) as e:
+        return None, f"Warning: Failed to load {filepath}: {e}"
+
+    # Handle array JSON files (some files are wrapped in arrays)
+    if isinstance(data, list):
+        if len(data) > 0 and isinstance(data[0], dict):
+            data = data[0]  # Take first element
+        else:
+            return None, f"Warning: Skipping {filepath} - array with no valid object"
+
+    if not isinstance(data, dict):
+        return None, f"Warning: Skipping {filepath} - not a valid object"
+
+    return extract_analysis_data(data, analysis_type), None
+
+
+def load_extract_cache() -> dict:
+    """
+    Load the extraction cache written by the previous run.
+
+    The cache is tagged with a hash of this script, so any change to the
+    extraction code invalidates it. Returns {filename: (mtime_ns, size, extracted)}.
+    """
+    if EXTRACT_CACHE_FILE is None or not EXTRACT_CACHE_FILE.exists():
+        return {}
+    try:
+        with open(EXTRACT_CACHE_FILE, 'rb') as f:
+            tag, entries = pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return {}
+    return entries if tag == _cache_tag() else {}
+
+
+def save_extract_cache(entries: dict):
+    """Write the extraction cache atomically (a partial write is never read back)."""
+    if EXTRACT_CACHE_FILE is None:
+        return
+    EXTRACT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = EXTRACT_CACHE_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'wb') as f:
+        pickle.dump((_cache_tag(), entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, EXTRACT_CACHE_FILE)
+
+
+def _cache_tag() -> str:
+    return hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+
 def load_all_sermons() -> dict:
     """
     Load all JSON files and group them by sermon (theologian + sermon_id).
+    Files are parsed and extracted in parallel worker processes; files that
+    are unchanged since the previous run are taken from the extraction cache.
 
     Returns:
-        dict[tuple[theologian, sermon_id], dict[analysis_type, data]]
+        dict[tuple[theologian, sermon_id], dict[analysis_type, extracted]]
+        where extracted maps column names to cell values
     """
     sermons = defaultdict(dict)
 
@@ -657,48 +854,71 @@ def load_all_sermons() -> dict:
         print(f"Error: Directory {DOCS_DIR} not found")
         return sermons
 
-    json_files = list(DOCS_DIR.glob("*.json"))
-    print(f"Found {len(json_files)} JSON files in {DOCS_DIR}")
+    with os.scandir(DOCS_DIR) as entries:
+        json_entries = [entry for entry in entries if entry.name.endswith('.json')]
+    print(f"Found {len(json_entries)} JSON files in {DOCS_DIR}")
 
     processed = 0
     skipped = 0
 
-    for filepath in sorted(json_files):
-        parsed = parse_filename(filepath.name)
+    # Sorted so analyses are stored in filename order: shared metadata.* columns
+    # take the value of the last analysis, which must not depend on the filesystem
+    json_entries.sort(key=lambda entry: entry.name)
+    cache = load_extract_cache()
+    new_cache = {}
+    results = {}
+    json_files = []
+    stale_files = []
+    for dir_entry in json_entries:
+        filepath = DOCS_DIR / dir_entry.name
+        json_files.append(filepath)
+        parsed = parse_filename(dir_entry.name)
         if not parsed:
+            # Special and Sölle B files are rejected by name alone: never stat'ed,
+            # opened or sent to a worker
+            results[filepath] = (None, None, None)
+            continue
+
+        stat = dir_entry.stat()
+        entry = cache.get(dir_entry.name)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            new_cache[dir_entry.name] = entry
+            results[filepath] = (parsed, entry[2], None)
+        else:
+            stale_files.append((filepath, parsed, stat))
+
+    if stale_files:
+        stale_paths = [filepath for filepath, _, _ in stale_files]
+        stale_types = [parsed[2] for _, parsed, _ in stale_files]
+        workers = MAX_WORKERS or os.cpu_count() or 1
+        if workers > 1 and len(stale_paths) > LOAD_CHUNKSIZE:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                stale_results = list(executor.map(load_sermon_file, stale_paths, stale_types,
+                                                  chunksize=LOAD_CHUNKSIZE))
+        else:
+            # A single CPU or a handful of changed files: a pool would only add
+            # process start-up and result pickling on top of the same work
+            stale_results = map(load_sermon_file, stale_paths, stale_types)
+        for (filepath, parsed, stat), (extracted, warning) in zip(stale_files, stale_results):
+            results[filepath] = (parsed, extracted, warning)
+            if extracted is not None:
+                new_cache[filepath.name] = (stat.st_mtime_ns, stat.st_size, extracted)
+
+    for filepath in json_files:
+        parsed, extracted, warning = results[filepath]
+        if warning:
+            print(warning)
+        if extracted is None:
             skipped += 1
             continue
 
         theologian, sermon_id, analysis_type = parsed
+        sermon_key = (theologian, sermon_id)
+        sermons[sermon_key][analysis_type] = extracted
+        processed += 1
 
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Handle array JSON files (some files are wrapped in arrays)
-            if isinstance(data, list):
-                if len(data) > 0 and isinstance(data[0], dict):
-                    data = data[0]  # Take first element
-                else:
-                    print(f"Warning: Skipping {filepath} - array with no valid object")
-                    skipped += 1
-                    continue
-
-            if not isinstance(data, dict):
-                print(f"Warning: Skipping {filepath} - not a valid object")
-                skipped += 1
-                continue
-
-            sermon_key = (theologian, sermon_id)
-            sermons[sermon_key][analysis_type] = {
-                'filename': filepath.name,
-                'data': data
-            }
-            processed += 1
-
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Failed to load {filepath}: {e}")
-            skipped += 1
+    if new_cache != cache:
+        save_extract_cache(new_cache)
 
     print(f"Successfully loaded {processed} analysis files")
     print(f"Skipped {skipped} files")
@@ -707,19 +927,68 @@ def load_all_sermons() -> dict:
     return sermons
 
 
+def cell_text(value: Any) -> str:
+    """Text of one cell as csv.writer writes it (None -> '', other values -> str)."""
+    if value is None:
+        return ''
+    return value if type(value) is str else str(value)
+
+
+def write_parquet(columns: list[str], values: list[list[str]]):
+    """
+    Write the table column by column to PARQUET_FILE.
+    Every column holds the same text as the corresponding TSV column.
+    """
+    table = pyarrow.table({column: column_values for column, column_values in zip(columns, values)})
+    pyarrow.parquet.write_table(table, PARQUET_FILE)
+    print(f"Parquet file created successfully: {PARQUET_FILE}")
+
+
+def tsv_row_formatter(quoting: int) -> Callable[[list], bytes]:
+    """
+    Return a function that formats one row as UTF-8 encoded TSV bytes,
+    matching csv.writer(delimiter='\\t', quoting=quoting) output.
+
+    QUOTE_ALL (the default) is formatted with a single str.join, which is
+    several times faster than the csv module for these long text cells.
+    """
+    if quoting == csv.QUOTE_ALL:
+        def format_row(row: list) -> bytes:
+            return ('"' + '"\t"'.join([cell_text(value).replace('"', '""') for value in row]) + '"\r\n').encode('utf-8')
+        return format_row
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter='\t', quoting=quoting)
+
+    def format_row(row: list) -> bytes:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(row)
+        return buffer.getvalue().encode('utf-8')
+    return format_row
+
+
+def open_output(path: Path) -> io.BufferedIOBase:
+    """Open the TSV for binary writing, through gzip when GZIP_LEVEL is set."""
+    if GZIP_LEVEL is None:
+        return open(path, 'wb', buffering=WRITE_BUFFER_SIZE)
+    # Buffer in front of the compressor so zlib sees large chunks, not single rows
+    return io.BufferedWriter(gzip.GzipFile(path, 'wb', compresslevel=GZIP_LEVEL),
+                             buffer_size=WRITE_BUFFER_SIZE)
+
+
 def create_tsv(sermons: dict):
     """
     Create a TSV file with one row per sermon and all analysis data.
+
+    The extracted columns are already held per file in sermons, so the rows
+    are built and written one at a time; only the current row list is live.
     """
     # Collect all possible column names
     all_columns = set(['theologian', 'sermon_id', 'sermon_key'])
-
-    # First pass: collect all column names
-    print("\nCollecting column names...")
-    for sermon_key, analyses in sermons.items():
-        for analysis_type, analysis_info in analyses.items():
-            data = analysis_info['data']
-            extracted = extract_analysis_data(data, analysis_type)
+    print("\nCollecting columns...")
+    for analyses in sermons.values():
+        for extracted in analyses.values():
             all_columns.update(extracted.keys())
 
     # Sort columns for consistent ordering
@@ -729,32 +998,45 @@ def create_tsv(sermons: dict):
 
     print(f"Total columns: {len(all_columns_ordered)}")
 
-    # Write TSV
-    print(f"\nWriting TSV to {OUTPUT_FILE}...")
-    with open(OUTPUT_FILE, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=all_columns_ordered, delimiter='\t',
-                               extrasaction='ignore', quoting=csv.QUOTE_ALL)
+    # Write TSV, streaming one row at a time
+    output_file = OUTPUT_FILE if GZIP_LEVEL is None else OUTPUT_FILE.with_name(OUTPUT_FILE.name + '.gz')
+    print(f"\nWriting TSV to {output_file}...")
+    col_index = {col: i for i, col in enumerate(all_columns_ordered)}
+    format_row = tsv_row_formatter(TSV_QUOTING)
+
+    # Column-oriented copy of the cells for the optional Parquet output
+    parquet_values = None
+    if PARQUET_FILE is not None:
+        if pyarrow is None:
+            print(f"Warning: pyarrow is not installed, not writing {PARQUET_FILE}")
+        else:
+            parquet_values = [[] for _ in all_columns_ordered]
 
-        writer.writeheader()
+    with open_output(output_file) as f:
+        f.write(format_row(all_columns_ordered))
 
-        for sermon_key, analyses in sorted(sermons.items()):
+        for sermon_key in sorted(sermons):
             theologian, sermon_id = sermon_key
+            row = [''] * len(all_columns_ordered)
+            row[0] = theologian
+            row[1] = sermon_id
+            row[2] = f"{theologian}_{sermon_id}"
+
+            # Place the pre-extracted data from all analyses by column position
+            for extracted in sermons[sermon_key].values():
+                for key, value in extracted.items():
+                    row[col_index[key]] = value
 
-            row = {
-                'theologian': theologian,
-                'sermon_id': sermon_id,
-                'sermon_key': f"{theologian}_{sermon_id}"
-            }
+            f.write(format_row(row))
 
-            # Extract data from all analyses for this sermon
-            for analysis_type, analysis_info in analyses.items():
-                data = analysis_info['data']
-                extracted = extract_analysis_data(data, analysis_type)
-                row.update(extracted)
+            if parquet_values is not None:
+                for column_values, value in zip(parquet_values, row):
+                    column_values.append(cell_text(value))
 
-            writer.writerow(row)
+    print(f"TSV file created successfully: {output_file}")
 
-    print(f"TSV file created successfully: {OUTPUT_FILE}")
+    if parquet_values is not None:
+        write_parquet(all_columns_ordered, parquet_values)
 
 
 def print_summary(sermons: dict):
@@ -789,7 +1071,7 @@ def print_summary(sermons: dict):
         if len(analyses) == 9:
             complete += 1
         else:
-            missing = set(ANALYSIS_TYPES) - set(analyses.keys())
+            missing = _ANALYSIS_TYPE_SET.difference(analyses)
             incomplete.append((sermon_key, missing))
 
     print(f"  - Complete sermons (all 9 analyses): {complete}")
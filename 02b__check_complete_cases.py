@@ -17,12 +17,25 @@ Usage:
 import json
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import csv
+import hashlib
+import os
+import pickle
 import sys
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
 # Configuration
 DOCS_DIR = Path("docs")
 OUTPUT_FILE = Path("data/incomplete_cases_report.tsv")
+MAX_WORKERS = None  # worker processes for checking files (None = all CPUs, 1 = no pool)
+CHECK_CHUNKSIZE = 16  # files handed to a worker per round trip
+# Per-file check results, reused on the next run while (mtime, size) match (None = no cache)
+CHECK_CACHE_FILE = Path("data/.check_cache.pickle")
 
 # Known analysis types
 ANALYSIS_TYPES = [
@@ -30,6 +43,12 @@ ANALYSIS_TYPES = [
     'esthetiek', 'transactional', 'metaphor', 'speech_act', 'narrative'
 ]
 
+_ANALYSIS_TYPE_SET = frozenset(ANALYSIS_TYPES)
+
+# Analysis types split on '_', for matching against filename parts without re-joining
+_ANALYSIS_PARTS = frozenset(tuple(analysis_type.split('_')) for analysis_type in ANALYSIS_TYPES)
+_ANALYSIS_LENGTHS = sorted({len(analysis_parts) for analysis_parts in _ANALYSIS_PARTS})
+
 # Critical score fields to check per analysis type (field path -> description)
 # These are the key numeric scores that should always be present
 # Note: Some fields like dekker.overall.average_score are computed by the converter
@@ -78,9 +97,16 @@ SCORE_FIELDS = {
 }
 
 
-def get_nested_value(data: dict, path: str):
-    """Get a value from a nested dictionary using dot notation."""
-    keys = path.split('.')
+# SCORE_FIELDS with each dotted path pre-split: (keys, field_path, field_name)
+_SCORE_KEYS = {
+    analysis_type: [(tuple(field_path.split('.')), field_path, field_name)
+                    for field_path, field_name in fields]
+    for analysis_type, fields in SCORE_FIELDS.items()
+}
+
+
+def get_nested_value(data: dict, keys: tuple[str, ...]):
+    """Get a value from a nested dictionary by a pre-split key path."""
     value = data
     for key in keys:
         if isinstance(value, dict) and key in value:
@@ -90,6 +116,18 @@ def get_nested_value(data: dict, path: str):
     return value
 
 
+def load_json(filepath: Path):
+    """Parse a JSON file, using orjson on the raw bytes when available."""
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # re-parse below so the report carries the stdlib error message
+    return json.loads(raw.decode('utf-8'))
+
+
 def parse_filename(filename: str) -> tuple[str, str, str] | None:
     """Parse a filename into (theologian, sermon_id, analysis_type).
 
@@ -114,13 +152,8 @@ def parse_filename(filename: str) -> tuple[str, str, str] | None:
 
     analysis_start_idx = None
     for i in range(1, len(parts)):
-        for analysis_type in ANALYSIS_TYPES:
-            analysis_parts = analysis_type.split('_')
-            candidate = '_'.join(parts[i:i + len(analysis_parts)])
-            if candidate == analysis_type:
-                analysis_start_idx = i
-                break
-        if analysis_start_idx is not None:
+        if any(tuple(parts[i:i + length]) in _ANALYSIS_PARTS for length in _ANALYSIS_LENGTHS):
+            analysis_start_idx = i
             break
 
     if analysis_start_idx is None or analysis_start_idx < 2:
@@ -133,6 +166,64 @@ def parse_filename(filename: str) -> tuple[str, str, str] | None:
     return theologian, sermon_id, analysis
 
 
+def check_analysis_file(filepath: Path, analysis_type: str) -> list[tuple[str, str, str]]:
+    """
+    Check one analysis file for missing score fields. Runs in a worker process.
+
+    Returns:
+        list of (issue_type, field, description)
+    """
+    try:
+        data = load_json(filepath)
+    except (json.JSONDecodeError, IOError) as e:
+        return [('read_error', '', f'Error reading file: {e}')]
+
+    if isinstance(data, list) and len(data) > 0:
+        data = data[0]
+
+    if not isinstance(data, dict):
+        return []
+
+    issues = []
+    for keys, field_path, field_name in _SCORE_KEYS.get(analysis_type, ()):
+        value = get_nested_value(data, keys)
+        if value is None or value == '':
+            issues.append(('missing_field', field_name, f'Field {field_path} is missing or empty'))
+    return issues
+
+
+def load_check_cache() -> dict:
+    """
+    Load the per-file check results written by the previous run.
+
+    The cache is tagged with a hash of this script, so any change to the
+    checks invalidates it. Returns {filename: (mtime_ns, size, issues)}.
+    """
+    if CHECK_CACHE_FILE is None or not CHECK_CACHE_FILE.exists():
+        return {}
+    try:
+        with open(CHECK_CACHE_FILE, 'rb') as f:
+            tag, entries = pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return {}
+    return entries if tag == _cache_tag() else {}
+
+
+def save_check_cache(entries: dict):
+    """Write the check cache atomically (a partial write is never read back)."""
+    if CHECK_CACHE_FILE is None:
+        return
+    CHECK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = CHECK_CACHE_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'wb') as f:
+        pickle.dump((_cache_tag(), entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, CHECK_CACHE_FILE)
+
+
+def _cache_tag() -> str:
+    return hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+
 def check_complete_cases():
     """Check for complete cases and return list of problems."""
     problems = []
@@ -144,15 +235,17 @@ def check_complete_cases():
         print(f"Error: Directory {DOCS_DIR} not found")
         return problems
 
-    json_files = list(DOCS_DIR.glob("*.json"))
+    # Names only; a Path is built just for the files that get checked
+    with os.scandir(DOCS_DIR) as entries:
+        json_entries = {entry.name: entry for entry in entries if entry.name.endswith('.json')}
 
-    for filepath in json_files:
-        parsed = parse_filename(filepath.name)
+    for name in json_entries:
+        parsed = parse_filename(name)
         if not parsed:
             continue
 
         theologian, sermon_id, analysis_type = parsed
-        if analysis_type in ANALYSIS_TYPES:
+        if analysis_type in _ANALYSIS_TYPE_SET:
             existing_files[(theologian, sermon_id)].add(analysis_type)
 
     # Get all unique sermons
@@ -160,69 +253,82 @@ def check_complete_cases():
 
     print(f"Checking {len(all_sermons)} sermons for completeness...\n")
 
-    # Check each sermon
+    # Resolve the file behind each (sermon, analysis) pair, in report order;
+    # filepath is None for a missing analysis
+    checks = []
     for theologian, sermon_id in all_sermons:
         sermon_key = f"{theologian}_{sermon_id}"
         present_analyses = existing_files[(theologian, sermon_id)]
 
-        # Check for missing files
+        # ANALYSIS_TYPES order, not a set difference: the report lists analyses in this order
         for analysis_type in ANALYSIS_TYPES:
             if analysis_type not in present_analyses:
-                problems.append({
-                    'theologian': theologian,
-                    'sermon_id': sermon_id,
-                    'sermon_key': sermon_key,
-                    'domain': analysis_type,
-                    'issue_type': 'missing_file',
-                    'field': '',
-                    'description': f'File {sermon_key}_{analysis_type}.json does not exist'
-                })
-            else:
-                # File exists, check for missing score fields
-                filepath = DOCS_DIR / f"{sermon_key}_{analysis_type}.json"
-                if not filepath.exists():
-                    # Try alternative naming
-                    possible_files = list(DOCS_DIR.glob(f"{theologian}_{sermon_id}_{analysis_type}.json"))
-                    if possible_files:
-                        filepath = possible_files[0]
-                    else:
-                        continue
-
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-
-                    if isinstance(data, list) and len(data) > 0:
-                        data = data[0]
-
-                    if not isinstance(data, dict):
-                        continue
-
-                    # Check score fields for this analysis type
-                    if analysis_type in SCORE_FIELDS:
-                        for field_path, field_name in SCORE_FIELDS[analysis_type]:
-                            value = get_nested_value(data, field_path)
-                            if value is None or value == '':
-                                problems.append({
-                                    'theologian': theologian,
-                                    'sermon_id': sermon_id,
-                                    'sermon_key': sermon_key,
-                                    'domain': analysis_type,
-                                    'issue_type': 'missing_field',
-                                    'field': field_name,
-                                    'description': f'Field {field_path} is missing or empty'
-                                })
-
-                except (json.JSONDecodeError, IOError) as e:
-                    problems.append({
-                        'theologian': theologian,
-                        'sermon_id': sermon_id,
-                        'sermon_key': sermon_key,
-                        'domain': analysis_type,
-                        'issue_type': 'read_error',
-                        'field': '',
-                        'description': f'Error reading file: {e}'
-                    })
+                checks.append((theologian, sermon_id, sermon_key, analysis_type, None))
+                continue
+
+            filepath = DOCS_DIR / f"{sermon_key}_{analysis_type}.json"
+            if filepath.name not in json_entries:
+                # Try alternative naming
+                possible_files = list(DOCS_DIR.glob(f"{theologian}_{sermon_id}_{analysis_type}.json"))
+                if possible_files:
+                    filepath = possible_files[0]
+                else:
+                    continue
+            checks.append((theologian, sermon_id, sermon_key, analysis_type, filepath))
+
+    # Reuse the results for files unchanged since the previous run
+    cache = load_check_cache()
+    new_cache = {}
+    file_issues = {}
+    stale_files = []
+    for _, _, _, analysis_type, filepath in checks:
+        if filepath is None:
+            continue
+        dir_entry = json_entries.get(filepath.name)
+        stat = dir_entry.stat() if dir_entry is not None else filepath.stat()
+        entry = cache.get(filepath.name)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            new_cache[filepath.name] = entry
+            file_issues[filepath] = entry[2]
+        else:
+            stale_files.append((filepath, analysis_type, stat))
+
+    # Check the remaining files for missing score fields, in parallel when it pays off
+    stale_paths = [filepath for filepath, _, _ in stale_files]
+    stale_types = [analysis_type for _, analysis_type, _ in stale_files]
+    workers = MAX_WORKERS or os.cpu_count() or 1
+    if workers > 1 and len(stale_paths) > CHECK_CHUNKSIZE:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            stale_issues = list(executor.map(check_analysis_file, stale_paths, stale_types,
+                                             chunksize=CHECK_CHUNKSIZE))
+    else:
+        stale_issues = list(map(check_analysis_file, stale_paths, stale_types))
+
+    for (filepath, _, stat), issues in zip(stale_files, stale_issues):
+        file_issues[filepath] = issues
+        # Read errors are not cached: they may be transient (e.g. permissions)
+        if not any(issue_type == 'read_error' for issue_type, _, _ in issues):
+            new_cache[filepath.name] = (stat.st_mtime_ns, stat.st_size, issues)
+
+    if new_cache != cache:
+        save_check_cache(new_cache)
+
+    for theologian, sermon_id, sermon_key, analysis_type, filepath in checks:
+        if filepath is None:
+            issues = [('missing_file', '', f'File {sermon_key}_{analysis_type}.json does not exist')]
+        else:
+            issues = file_issues[filepath]
+
+        for issue_type, field, description in issues:
+            problems.append({
+                'theologian': theologian,
+                'sermon_id': sermon_id,
+                'sermon_key': sermon_key,
+                'domain': analysis_type,
+                'issue_type': issue_type,
+                'field': field,
+                'description': description
+            })
 
     return problems
 